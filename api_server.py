@@ -4,37 +4,139 @@ Flask-based HTTP endpoints for pixel control and display management.
 """
 
 import asyncio
+import concurrent.futures
+import functools
+import logging
 import threading
+import time
 from flask import Flask, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
-from typing import List, Tuple
-import base64
+from typing import Dict, List, Tuple
+import io
+from operator import itemgetter
+import numpy as np
+from PIL import Image
+
+try:
+    # SIMD-accelerated decoder (AVX2/NEON); same API as stdlib base64
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from matrix_controller import get_controller, MatrixController
 from grid_manager import get_grid_manager, GridManager
 from display_registry import get_registry
 
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that parses requests and serializes responses with orjson."""
+    
+    option = 0
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self.default, option=self.option).decode()
+    
+    def loads(self, s, **kwargs):
+        # request.get_json() hands over the raw body bytes; no decode needed
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Build the body straight from orjson's bytes, no str round-trip
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self.option)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
 # Flask app
 app = Flask(__name__)
 CORS(app)  # Enable CORS for browser access
+if orjson is not None:
+    ORJSONProvider.option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    app.json = ORJSONProvider(app)
 
 # Async event loop for Bluetooth operations
 _loop: asyncio.AbstractEventLoop = None
 _controller: MatrixController = None
 _grid: GridManager = None
 
+# Display list/health snapshots are shared for this long (seconds);
+# _displays_generation is bumped on connect/disconnect/scan to invalidate
+DISPLAYS_CACHE_TTL = 0.1
+_displays_generation = 0
+
+# Upper bound for a BLE operation to hold a request thread (seconds)
+BLE_OP_TIMEOUT = 60
+
+# Single-pass MAC normalization: aa-bb-... -> AA:BB:...
+_MAC_TABLE = str.maketrans('-abcdef', ':ABCDEF')
+
+# Content types accepted as raw row-major RGB bytes (no JSON/base64)
+RAW_RGB_MIMETYPES = ('application/octet-stream', 'image/rgb')
+
+
+def run_async(coro, timeout: float = BLE_OP_TIMEOUT):
+    """
+    Run async coroutine from sync Flask context.
+    
+    Only needed for BLE I/O; buffer-only operations are called directly.
+    Raises concurrent.futures.TimeoutError (after cancelling the coroutine)
+    so a stuck BLE operation cannot pin a request thread forever.
+    """
+    future = asyncio.run_coroutine_threadsafe(coro, _loop)
+    try:
+        return future.result(timeout=timeout)
+    except concurrent.futures.TimeoutError:
+        future.cancel()
+        raise
+
+
+def _norm_mac(mac_address: str) -> str:
+    """Normalize MAC address to upper-case, colon-separated form."""
+    return mac_address.translate(_MAC_TABLE)
+
 
-def run_async(coro):
-    """Run async coroutine from sync Flask context."""
-    return asyncio.run_coroutine_threadsafe(coro, _loop).result()
+@app.url_value_preprocessor
+def _normalize_mac_arg(endpoint, values):
+    """Normalize <mac_address> URL values once, before dispatch."""
+    if values and 'mac_address' in values:
+        values['mac_address'] = _norm_mac(values['mac_address'])
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_displays(tick: int, generation: int) -> Tuple[List[Dict], int]:
+    """Build (displays, connected_count) once per TTL tick/generation."""
+    displays = _controller.get_displays()
+    connected = sum(1 for d in displays if d.get('state') == 'connected')
+    return displays, connected
+
+
+def _displays_snapshot() -> Tuple[List[Dict], int]:
+    """Get (displays, connected_count), coalescing concurrent polls."""
+    tick = int(time.monotonic() / DISPLAYS_CACHE_TTL)
+    return _cached_displays(tick, _displays_generation)
+
+
+def _invalidate_displays() -> None:
+    """Drop the cached display snapshot after a registry change."""
+    global _displays_generation
+    _displays_generation += 1
+
+
+def _json(force: bool = False) -> dict:
+    """Parse the JSON body once per request ({} if missing or invalid)."""
+    return request.get_json(force=force, silent=True, cache=True) or {}
 
 
 # ==================== Display Management ====================
 
-@app.route('/displays', methods=['GET'])
 def list_displays():
     """Get all registered displays."""
-    displays = _controller.get_displays()
+    displays, _ = _displays_snapshot()
     return jsonify({
         "success": True,
         "displays": displays,
@@ -42,77 +144,64 @@ def list_displays():
     })
 
 
-@app.route('/displays/scan', methods=['GET', 'POST'])
 def scan_displays():
     """Scan for MI Matrix Display devices."""
-    # Get timeout from query string or JSON body
-    timeout = 10
-    if request.method == 'POST' and request.data:
-        try:
-            data = request.get_json(force=True, silent=True)
-            if data and 'timeout' in data:
-                timeout = data['timeout']
-        except:
-            pass
-    elif request.args.get('timeout'):
-        timeout = int(request.args.get('timeout'))
+    # Get timeout from JSON body, falling back to query string
+    timeout = _json(force=True).get(
+        'timeout', request.args.get('timeout', 10, type=int))
     
     try:
-        devices = run_async(_controller.scan(timeout))
+        devices = run_async(_controller.scan(timeout), timeout=timeout + 10)
+        _invalidate_displays()
         return jsonify({
             "success": True,
             "devices_found": devices,
             "count": len(devices)
         })
+    except concurrent.futures.TimeoutError:
+        return jsonify({"success": False, "error": "Scan timed out"}), 504
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
 
-@app.route('/displays/<mac_address>/connect', methods=['GET', 'POST'])
 def connect_display(mac_address: str):
     """Connect to a display by MAC address."""
-    # Normalize MAC address format
-    mac_address = mac_address.replace('-', ':').upper()
-    
-    # Get grid_position from query string or JSON body
-    grid_position = None
-    if request.method == 'POST' and request.data:
-        try:
-            data = request.get_json(force=True, silent=True)
-            if data and 'grid_position' in data:
-                grid_position = data['grid_position']
-        except:
-            pass
-    elif request.args.get('grid_position'):
-        grid_position = int(request.args.get('grid_position'))
+    # Get grid_position from JSON body, falling back to query string
+    grid_position = _json(force=True).get(
+        'grid_position', request.args.get('grid_position', type=int))
     
     try:
-        success = run_async(_controller.connect_display(mac_address, grid_position))
+        try:
+            success = run_async(_controller.connect_display(mac_address, grid_position))
+        finally:
+            _invalidate_displays()
         return jsonify({
             "success": success,
             "mac_address": mac_address,
             "grid_position": grid_position
         })
+    except concurrent.futures.TimeoutError:
+        return jsonify({"success": False, "error": "Connection timed out"}), 504
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
 
-@app.route('/displays/<mac_address>/disconnect', methods=['POST'])
 def disconnect_display(mac_address: str):
     """Disconnect from a display."""
-    mac_address = mac_address.replace('-', ':').upper()
-    
     try:
-        run_async(_controller.disconnect_display(mac_address))
+        try:
+            run_async(_controller.disconnect_display(mac_address))
+        finally:
+            _invalidate_displays()
         return jsonify({"success": True, "mac_address": mac_address})
+    except concurrent.futures.TimeoutError:
+        return jsonify({"success": False, "error": "Disconnect timed out"}), 504
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
 
-@app.route('/displays/<mac_address>/status', methods=['GET'])
 def display_status(mac_address: str):
     """Get display status."""
-    mac_address = mac_address.replace('-', ':').upper()
     display = _controller.get_display(mac_address)
     
     if display:
@@ -123,15 +212,40 @@ def display_status(mac_address: str):
 
 # ==================== Pixel Operations ====================
 
-@app.route('/displays/<mac_address>/pixel', methods=['POST'])
+_PIXEL_FIELDS = itemgetter('x', 'y', 'r', 'g', 'b')
+
+
+def _pixel_rows(pixels: list) -> np.ndarray:
+    """
+    Convert a JSON pixel list to an (N, 5) array of x, y, r, g, b rows.
+    
+    Accepts [[x, y, r, g, b], ...] directly, or dicts where missing
+    r/g/b default to 255.
+    """
+    if not isinstance(pixels, list):
+        raise ValueError("pixels must be a list")
+    if pixels and isinstance(pixels[0], dict):
+        try:
+            return np.fromiter(
+                (v for p in pixels for v in _PIXEL_FIELDS(p)),
+                dtype=np.int64, count=len(pixels) * 5
+            ).reshape(-1, 5)
+        except KeyError:
+            # Some pixels omit color channels; fill in defaults
+            pixels = [
+                [p['x'], p['y'], p.get('r', 255), p.get('g', 255), p.get('b', 255)]
+                for p in pixels
+            ]
+    return np.asarray(pixels, dtype=np.int64).reshape(-1, 5)
+
+
 def set_pixel(mac_address: str):
     """
     Set a single pixel.
     
     Body: {"x": 0, "y": 0, "r": 255, "g": 0, "b": 0}
     """
-    mac_address = mac_address.replace('-', ':').upper()
-    data = request.json
+    data = _json()
     
     if not data:
         return jsonify({"success": False, "error": "No data provided"}), 400
@@ -149,45 +263,49 @@ def set_pixel(mac_address: str):
         return jsonify({"success": False, "error": str(e)}), 400
 
 
-@app.route('/displays/<mac_address>/pixels', methods=['POST'])
 def set_pixels(mac_address: str):
     """
     Set multiple pixels at once.
     
     Body: {"pixels": [{"x": 0, "y": 0, "r": 255, "g": 0, "b": 0}, ...]}
+    or:   {"pixels": [[x, y, r, g, b], ...]} (fast path, all fields required)
     """
-    mac_address = mac_address.replace('-', ':').upper()
-    data = request.json
+    data = _json()
     
     if not data or 'pixels' not in data:
         return jsonify({"success": False, "error": "No pixels provided"}), 400
     
     try:
-        count = 0
-        for p in data['pixels']:
-            success = _controller.set_pixel(
-                mac_address, 
-                int(p['x']), int(p['y']),
-                int(p.get('r', 255)), int(p.get('g', 255)), int(p.get('b', 255))
-            )
-            if success:
-                count += 1
+        pixels = _pixel_rows(data['pixels'])
+        count = _controller.set_pixels_batch(mac_address, pixels)
         
         return jsonify({"success": True, "pixels_set": count})
-    except (KeyError, ValueError) as e:
+    except (KeyError, ValueError, TypeError, OverflowError) as e:
         return jsonify({"success": False, "error": str(e)}), 400
 
 
-@app.route('/displays/<mac_address>/image', methods=['POST'])
 def set_image(mac_address: str):
     """
     Set full 16x16 image.
     
     Body: {"pixels": [[r,g,b], [r,g,b], ...]} (256 RGB arrays)
     or:   {"image_base64": "..."} (base64 encoded image)
+    or:   768 raw RGB bytes (Content-Type: application/octet-stream)
     """
-    mac_address = mac_address.replace('-', ':').upper()
-    data = request.json
+    if request.mimetype in RAW_RGB_MIMETYPES:
+        raw = request.get_data(cache=False)
+        if len(raw) != 256 * 3:
+            return jsonify({
+                "success": False,
+                "error": f"Expected {256 * 3} bytes, got {len(raw)}"
+            }), 400
+        
+        # Packed RGB is the registry's native frame format: no reshape, and
+        # the same bytes object is reused as the BLE payload
+        success = _controller.set_image(mac_address, raw)
+        return jsonify({"success": success})
+    
+    data = _json()
     
     if not data:
         return jsonify({"success": False, "error": "No data provided"}), 400
@@ -195,7 +313,7 @@ def set_image(mac_address: str):
     try:
         if 'pixels' in data:
             # Direct pixel array
-            pixels = [(p[0], p[1], p[2]) for p in data['pixels']]
+            pixels = np.asarray(data['pixels'])
             if len(pixels) != 256:
                 return jsonify({
                     "success": False, 
@@ -206,20 +324,13 @@ def set_image(mac_address: str):
             
         elif 'image_base64' in data:
             # Base64 image
-            from grid_manager import get_grid_manager
-            from PIL import Image
-            import io
-            
-            img_data = base64.b64decode(data['image_base64'])
-            img = Image.open(io.BytesIO(img_data))
-            img = img.resize((16, 16)).convert('RGB')
-            
-            pixels = []
-            for y in range(16):
-                for x in range(16):
-                    p = img.getpixel((x, y))
-                    pixels.append((p[0], p[1], p[2]))
+            img_data = base64.b64decode(data['image_base64'], validate=False)
+            img = Image.open(io.BytesIO(img_data)).convert('RGB')
+            if img.size != (16, 16):
+                img = img.resize((16, 16), Image.Resampling.BILINEAR)
             
+            # Bulk-convert the raster instead of 256 getpixel() calls
+            pixels = np.asarray(img, dtype=np.uint8).reshape(-1, 3)
             success = _controller.set_image(mac_address, pixels)
         else:
             return jsonify({"success": False, "error": "No pixels or image provided"}), 400
@@ -229,23 +340,50 @@ def set_image(mac_address: str):
         return jsonify({"success": False, "error": str(e)}), 500
 
 
-@app.route('/displays/<mac_address>/clear', methods=['POST'])
+def set_region(mac_address: str):
+    """
+    Paint a run of consecutive pixels (row-major) from packed RGB bytes.
+    
+    Body: raw RGB bytes, 3 per pixel (Content-Type: application/octet-stream)
+          with the first pixel index in ?start=N
+    or:   {"start": 0, "rgb_base64": "..."}
+    """
+    if request.mimetype in RAW_RGB_MIMETYPES:
+        start = request.args.get('start', 0, type=int)
+        rgb = request.get_data(cache=False)
+    else:
+        data = _json()
+        if not data or 'rgb_base64' not in data:
+            return jsonify({"success": False, "error": "No RGB data provided"}), 400
+        try:
+            start = int(data.get('start', 0))
+            rgb = base64.b64decode(data['rgb_base64'], validate=False)
+        except (TypeError, ValueError) as e:
+            return jsonify({"success": False, "error": str(e)}), 400
+    
+    if len(rgb) % 3 or not 0 <= start <= 256 - len(rgb) // 3:
+        return jsonify({
+            "success": False,
+            "error": f"{len(rgb)} bytes at pixel {start} do not fit the 256-pixel buffer"
+        }), 400
+    
+    success = _controller.set_region(mac_address, start, rgb)
+    return jsonify({"success": success})
+
+
 def clear_display(mac_address: str):
     """Clear display to black."""
-    mac_address = mac_address.replace('-', ':').upper()
     success = _controller.clear_display(mac_address)
     return jsonify({"success": success})
 
 
-@app.route('/displays/<mac_address>/fill', methods=['POST'])
 def fill_display(mac_address: str):
     """
     Fill display with solid color.
     
     Body: {"r": 255, "g": 0, "b": 0}
     """
-    mac_address = mac_address.replace('-', ':').upper()
-    data = request.json or {}
+    data = _json()
     
     r = int(data.get('r', 0))
     g = int(data.get('g', 0))
@@ -257,7 +395,6 @@ def fill_display(mac_address: str):
 
 # ==================== Grid Operations ====================
 
-@app.route('/grid', methods=['GET'])
 def get_grid_status():
     """Get 4x4 grid status."""
     return jsonify({
@@ -271,14 +408,13 @@ def get_grid_status():
     })
 
 
-@app.route('/grid/pixel', methods=['POST'])
 def set_global_pixel():
     """
     Set pixel in global 64x64 grid.
     
     Body: {"x": 0, "y": 0, "r": 255, "g": 0, "b": 0}
     """
-    data = request.json
+    data = _json()
     if not data:
         return jsonify({"success": False, "error": "No data"}), 400
     
@@ -294,33 +430,43 @@ def set_global_pixel():
         return jsonify({"success": False, "error": str(e)}), 400
 
 
-@app.route('/grid/image', methods=['POST'])
 def set_grid_image():
     """
     Set full 64x64 grid image.
     
     Body: {"image_base64": "..."} (base64 encoded image)
+    or:   12288 raw RGB bytes (Content-Type: application/octet-stream)
     """
-    data = request.json
+    if request.mimetype in RAW_RGB_MIMETYPES:
+        raw = request.get_data(cache=False)
+        expected = _grid.TOTAL_WIDTH * _grid.TOTAL_HEIGHT * 3
+        if len(raw) != expected:
+            return jsonify({
+                "success": False,
+                "error": f"Expected {expected} bytes, got {len(raw)}"
+            }), 400
+        
+        success = _grid.load_rgb_bytes(raw)
+        return jsonify({"success": success})
+    
+    data = _json()
     if not data or 'image_base64' not in data:
         return jsonify({"success": False, "error": "No image provided"}), 400
     
     try:
-        img_data = base64.b64decode(data['image_base64'])
+        img_data = base64.b64decode(data['image_base64'], validate=False)
         success = _grid.load_image_bytes(img_data)
         return jsonify({"success": success})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
 
-@app.route('/grid/clear', methods=['POST'])
 def clear_grid():
     """Clear entire grid to black."""
     _grid.clear_grid()
     return jsonify({"success": True})
 
 
-@app.route('/grid/schedule', methods=['GET'])
 def get_update_schedule():
     """Get update schedule for connected displays."""
     interval = request.args.get('interval_ms', 1000, type=int)
@@ -330,10 +476,9 @@ def get_update_schedule():
 
 # ==================== By Grid Position ====================
 
-@app.route('/position/<int:position>/pixel', methods=['POST'])
 def set_pixel_by_position(position: int):
     """Set pixel on display at grid position."""
-    data = request.json
+    data = _json()
     if not data:
         return jsonify({"success": False, "error": "No data"}), 400
     
@@ -350,15 +495,14 @@ def set_pixel_by_position(position: int):
         return jsonify({"success": False, "error": str(e)}), 400
 
 
-@app.route('/position/<int:position>/image', methods=['POST'])
 def set_image_by_position(position: int):
     """Set image on display at grid position."""
-    data = request.json
+    data = _json()
     if not data or 'pixels' not in data:
         return jsonify({"success": False, "error": "No pixels"}), 400
     
     try:
-        pixels = [(p[0], p[1], p[2]) for p in data['pixels']]
+        pixels = np.asarray(data['pixels'])
         success = _controller.set_image_by_position(position, pixels)
         return jsonify({"success": success})
     except Exception as e:
@@ -367,7 +511,6 @@ def set_image_by_position(position: int):
 
 # ==================== Root Route ====================
 
-@app.route('/', methods=['GET'])
 def index():
     """Root endpoint - shows API is running."""
     return jsonify({
@@ -379,18 +522,20 @@ def index():
             "POST /displays/scan",
             "POST /displays/<mac>/connect",
             "POST /displays/<mac>/pixel",
-            "POST /displays/<mac>/image"
+            "POST /displays/<mac>/image",
+            "POST /displays/<mac>/image (application/octet-stream, 768 RGB bytes)",
+            "POST /displays/<mac>/region?start=N (application/octet-stream, RGB bytes)",
+            "POST /grid/image",
+            "POST /grid/image (application/octet-stream, 12288 RGB bytes)"
         ]
     })
 
 
 # ==================== Health Check ====================
 
-@app.route('/health', methods=['GET'])
 def health_check():
     """API health check."""
-    displays = _controller.get_displays()
-    connected = sum(1 for d in displays if d.get('state') == 'connected')
+    displays, connected = _displays_snapshot()
     
     return jsonify({
         "status": "healthy",
@@ -399,6 +544,36 @@ def health_check():
     })
 
 
+# ==================== Route Table ====================
+
+# (rule, methods, view) - registered in one pass below
+ROUTES = [
+    ('/displays',                          'GET',      list_displays),
+    ('/displays/scan',                     'GET|POST', scan_displays),
+    ('/displays/<mac_address>/connect',    'GET|POST', connect_display),
+    ('/displays/<mac_address>/disconnect', 'POST',     disconnect_display),
+    ('/displays/<mac_address>/status',     'GET',      display_status),
+    ('/displays/<mac_address>/pixel',      'POST',     set_pixel),
+    ('/displays/<mac_address>/pixels',     'POST',     set_pixels),
+    ('/displays/<mac_address>/image',      'POST',     set_image),
+    ('/displays/<mac_address>/region',     'POST',     set_region),
+    ('/displays/<mac_address>/clear',      'POST',     clear_display),
+    ('/displays/<mac_address>/fill',       'POST',     fill_display),
+    ('/grid',                              'GET',      get_grid_status),
+    ('/grid/pixel',                        'POST',     set_global_pixel),
+    ('/grid/image',                        'POST',     set_grid_image),
+    ('/grid/clear',                        'POST',     clear_grid),
+    ('/grid/schedule',                     'GET',      get_update_schedule),
+    ('/position/<int:position>/pixel',     'POST',     set_pixel_by_position),
+    ('/position/<int:position>/image',     'POST',     set_image_by_position),
+    ('/',                                  'GET',      index),
+    ('/health',                            'GET',      health_check),
+]
+
+for _rule, _methods, _view in ROUTES:
+    app.add_url_rule(_rule, view_func=_view, methods=_methods.split('|'))
+
+
 # ==================== Server Startup ====================
 
 def start_async_loop():
@@ -409,14 +584,16 @@ def start_async_loop():
     _loop.run_forever()
 
 
-def run_server(host: str = '0.0.0.0', port: int = 5000, debug: bool = False):
+def run_server(host: str = '0.0.0.0', port: int = 5000, debug: bool = False,
+               production: bool = False):
     """
     Start the API server.
     
     Args:
         host: Bind address (0.0.0.0 for network access)
         port: Port number
-        debug: Flask debug mode
+        debug: Flask debug mode (always uses the Flask dev server)
+        production: Serve with waitress (threaded WSGI server)
     """
     global _controller, _grid
     
@@ -425,7 +602,6 @@ def run_server(host: str = '0.0.0.0', port: int = 5000, debug: bool = False):
     loop_thread.start()
     
     # Wait for loop to start
-    import time
     while _loop is None:
         time.sleep(0.1)
     
@@ -453,10 +629,34 @@ def run_server(host: str = '0.0.0.0', port: int = 5000, debug: bool = False):
     print("=" * 50)
     print("")
     
+    if production and not debug:
+        try:
+            from waitress import serve
+        except ImportError:
+            print("waitress not installed, falling back to Flask dev server")
+        else:
+            serve(app, host=host, port=port, threads=8,
+                  connection_limit=200, channel_timeout=30)
+            return
+    
     # Run Flask
     app.run(host=host, port=port, debug=debug, threaded=True)
 
 
 if __name__ == '__main__':
-    run_server()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="MI Matrix Display API Server")
+    parser.add_argument('--host', default='0.0.0.0', help="Bind address")
+    parser.add_argument('--port', type=int, default=5000, help="Port number")
+    parser.add_argument('--debug', action='store_true', help="Flask debug mode")
+    parser.add_argument('--production', action='store_true',
+                        help="Serve with waitress instead of the Flask dev server")
+    args = parser.parse_args()
+    
+    logging.basicConfig(
+        level=logging.DEBUG if args.debug else logging.INFO,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    )
+    run_server(args.host, args.port, debug=args.debug, production=args.production)
 
@@ -12,29 +12,47 @@ DEVICE_NAME = "MI Matrix Display"
 SERVICE_UUID = "0000ffd0-0000-1000-8000-00805f9b34fb"
 
 
-async def scan_all_ble_devices(timeout: int = 10):
-    """Scan for all BLE devices and show details."""
-    print(f"Scanning for all BLE devices for {timeout} seconds...")
-    print("-" * 60)
+def _device_info(device, adv_data) -> dict:
+    """Summarize a BLE advertisement for display."""
+    return {
+        "name": device.name or "Unknown",
+        "address": device.address,
+        "rssi": adv_data.rssi,
+        "service_uuids": list(adv_data.service_uuids) if adv_data.service_uuids else []
+    }
+
+
+async def scan_all_ble_devices(timeout: int = 10, verbose: bool = False):
+    """
+    Scan for BLE devices and show MI Matrix Display details.
     
-    devices = await BleakScanner.discover(timeout=timeout, return_adv=True)
+    Args:
+        timeout: Scan duration in seconds
+        verbose: Also collect and list other (non-MI) BLE devices
+    """
+    print(f"Scanning for BLE devices for {timeout} seconds...")
+    print("-" * 60)
     
-    mi_displays = []
-    other_devices = []
+    # Keyed by address; repeated advertisements just refresh the entry
+    found_displays = {}
+    found_others = {}
     
-    for device, adv_data in devices.values():
-        info = {
-            "name": device.name or "Unknown",
-            "address": device.address,
-            "rssi": adv_data.rssi,
-            "service_uuids": list(adv_data.service_uuids) if adv_data.service_uuids else []
-        }
-        
-        # Check if it's an MI Matrix Display
+    def callback(device, adv_data):
+        # Filter before building anything for the (many) other devices
         if device.name and DEVICE_NAME in device.name:
-            mi_displays.append(info)
-        else:
-            other_devices.append(info)
+            found_displays[device.address] = _device_info(device, adv_data)
+        elif verbose:
+            found_others[device.address] = _device_info(device, adv_data)
+    
+    scanner = BleakScanner(detection_callback=callback)
+    await scanner.start()
+    try:
+        await asyncio.sleep(timeout)
+    finally:
+        await scanner.stop()
+    
+    mi_displays = list(found_displays.values())
+    other_devices = list(found_others.values())
     
     # Print MI Matrix Displays first (the ones we care about)
     print("\n=== MI MATRIX DISPLAYS FOUND ===")
@@ -50,12 +68,13 @@ async def scan_all_ble_devices(timeout: int = 10):
         print("  Make sure the display is powered on and in pairing mode.")
     
     # Print other devices
-    print(f"\n=== OTHER BLE DEVICES ({len(other_devices)}) ===")
-    for d in sorted(other_devices, key=lambda x: x['rssi'], reverse=True)[:10]:
-        print(f"  {d['name']:30} | {d['address']} | RSSI: {d['rssi']}")
-    
-    if len(other_devices) > 10:
-        print(f"  ... and {len(other_devices) - 10} more devices")
+    if verbose:
+        print(f"\n=== OTHER BLE DEVICES ({len(other_devices)}) ===")
+        for d in sorted(other_devices, key=lambda x: x['rssi'], reverse=True)[:10]:
+            print(f"  {d['name']:30} | {d['address']} | RSSI: {d['rssi']}")
+        
+        if len(other_devices) > 10:
+            print(f"  ... and {len(other_devices) - 10} more devices")
     
     return mi_displays
 
@@ -131,8 +150,10 @@ async def continuous_scan(duration: int = 60):
     
     scanner = BleakScanner(detection_callback=callback)
     await scanner.start()
-    await asyncio.sleep(duration)
-    await scanner.stop()
+    try:
+        await asyncio.sleep(duration)
+    finally:
+        await scanner.stop()
     
     print(f"\n\nScan complete. Found {len(found_displays)} MI displays:")
     for addr, dev in found_displays.items():
@@ -166,10 +187,14 @@ if __name__ == "__main__":
             # Long continuous scan
             duration = int(sys.argv[2]) if len(sys.argv) > 2 else 60
             asyncio.run(continuous_scan(duration))
+        elif cmd == "all":
+            # Quick scan that also lists non-MI devices
+            asyncio.run(scan_all_ble_devices(timeout=10, verbose=True))
         elif cmd == "help":
             print("""
 Usage:
   python bt_scanner.py              - Quick scan (10 sec)
+  python bt_scanner.py all          - Quick scan, also list other BLE devices
   python bt_scanner.py continuous   - Continuous scan (60 sec)
   python bt_scanner.py continuous 120 - Continuous scan for 120 sec
   python bt_scanner.py detailed AA:BB:CC:DD:EE:FF - Detailed scan of MAC
@@ -3,11 +3,19 @@ Configuration Manager for MI Matrix Display System
 Handles persistent storage of device addresses and grid configuration.
 """
 
+import atexit
 import json
 import os
+import threading
+import time
 from pathlib import Path
 from typing import Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Default config location
 DEFAULT_CONFIG_PATH = Path.home() / ".mi_matrix_displays" / "config.json"
 
@@ -15,9 +23,23 @@ DEFAULT_CONFIG_PATH = Path.home() / ".mi_matrix_displays" / "config.json"
 class ConfigManager:
     """Manages configuration and device address storage for MI Matrix Displays."""
     
+    # Seconds to wait after a change before writing, so bursts coalesce
+    SAVE_DEBOUNCE = 0.5
+    
     def __init__(self, config_path: Optional[Path] = None):
         self.config_path = config_path or DEFAULT_CONFIG_PATH
         self.config: Dict = self._load_config()
+        self._pos_to_mac: Dict[int, str] = self._build_position_index()
+        
+        # Background writer: save() only marks dirty, the thread writes
+        self._dirty = False
+        self._save_lock = threading.Lock()
+        self._save_event = threading.Event()
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="config-writer", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.flush)
     
     def _ensure_config_dir(self) -> None:
         """Create config directory if it doesn't exist."""
@@ -27,12 +49,23 @@ class ConfigManager:
         """Load configuration from JSON file."""
         if self.config_path.exists():
             try:
+                if orjson is not None:
+                    return orjson.loads(self.config_path.read_bytes())
                 with open(self.config_path, 'r') as f:
                     return json.load(f)
             except (json.JSONDecodeError, IOError):
                 pass
         return self._default_config()
     
+    def _build_position_index(self) -> Dict[int, str]:
+        """Build grid position -> MAC reverse index from the config."""
+        index = {}
+        for mac, info in self.config["displays"].items():
+            position = info.get("grid_position")
+            if position is not None and position not in index:
+                index[position] = mac
+        return index
+    
     def _default_config(self) -> Dict:
         """Return default configuration structure."""
         return {
@@ -43,15 +76,63 @@ class ConfigManager:
             },
             "displays": {},  # MAC address -> display info
             "scan_timeout": 20,
+            "scan_service_filter": False,  # Pre-filter scans by service UUID
+            "gatt_cache": {},  # MAC -> {"char_handle", "mtu"} from the last connect
             "connection_retry_count": 3,
             "update_interval_ms": 1000  # 1 second per display
         }
     
-    def save(self) -> None:
-        """Save current configuration to file."""
+    def save(self, pretty: bool = False) -> None:
+        """
+        Save current configuration to file.
+        
+        Writes are deferred to a background thread and coalesced;
+        pretty=True writes indented JSON immediately instead.
+        """
+        self._dirty = True
+        if pretty:
+            self.flush(pretty=True)
+        else:
+            self._save_event.set()
+    
+    def flush(self, pretty: bool = False) -> None:
+        """Write pending configuration changes to file now."""
+        with self._save_lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            try:
+                if orjson is not None:
+                    # C serializer: indenting is cheap, so always pretty
+                    data = orjson.dumps(self.config, option=orjson.OPT_INDENT_2)
+                elif pretty:
+                    data = json.dumps(self.config, indent=2).encode()
+                else:
+                    data = json.dumps(self.config, separators=(',', ':')).encode()
+            except RuntimeError:
+                # Config mutated mid-serialization; retry on next wake
+                self._dirty = True
+                self._save_event.set()
+                return
+            self._write_atomic(data)
+    
+    def _write_atomic(self, data: bytes) -> None:
+        """Write to a temp file and rename over the config file."""
         self._ensure_config_dir()
-        with open(self.config_path, 'w') as f:
-            json.dump(self.config, f, indent=2)
+        tmp_path = self.config_path.with_name(self.config_path.name + ".tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, self.config_path)
+    
+    def _writer_loop(self) -> None:
+        """Background thread: flush whenever save() has been requested."""
+        while True:
+            self._save_event.wait()
+            time.sleep(self.SAVE_DEBOUNCE)
+            self._save_event.clear()
+            try:
+                self.flush()
+            except OSError as e:
+                print(f"Failed to save config: {e}")
     
     # Display Management
     def add_display(self, mac_address: str, name: str = "", 
@@ -67,6 +148,12 @@ class ConfigManager:
         if not name:
             name = f"Display_{len(self.config['displays'])}"
         
+        old_info = self.config["displays"].get(mac_address)
+        if old_info is not None:
+            self._unindex_position(mac_address, old_info.get("grid_position"))
+        if grid_position is not None:
+            self._pos_to_mac[grid_position] = mac_address
+        
         self.config["displays"][mac_address] = {
             "name": name,
             "grid_position": grid_position,
@@ -77,7 +164,8 @@ class ConfigManager:
     def remove_display(self, mac_address: str) -> bool:
         """Remove a display from configuration."""
         if mac_address in self.config["displays"]:
-            del self.config["displays"][mac_address]
+            info = self.config["displays"].pop(mac_address)
+            self._unindex_position(mac_address, info.get("grid_position"))
             self.save()
             return True
         return False
@@ -92,10 +180,12 @@ class ConfigManager:
     
     def get_display_by_position(self, position: int) -> Optional[str]:
         """Get MAC address of display at grid position."""
-        for mac, info in self.config["displays"].items():
-            if info.get("grid_position") == position:
-                return mac
-        return None
+        return self._pos_to_mac.get(position)
+    
+    def _unindex_position(self, mac_address: str, position: Optional[int]) -> None:
+        """Drop a position from the reverse index if it maps to this MAC."""
+        if position is not None and self._pos_to_mac.get(position) == mac_address:
+            del self._pos_to_mac[position]
     
     def set_grid_position(self, mac_address: str, position: int) -> bool:
         """
@@ -109,12 +199,15 @@ class ConfigManager:
             return False
         
         # Clear any existing display at this position
-        for mac, info in self.config["displays"].items():
-            if info.get("grid_position") == position:
-                info["grid_position"] = None
+        old_mac = self._pos_to_mac.pop(position, None)
+        if old_mac is not None:
+            self.config["displays"][old_mac]["grid_position"] = None
         
-        if mac_address in self.config["displays"]:
-            self.config["displays"][mac_address]["grid_position"] = position
+        info = self.config["displays"].get(mac_address)
+        if info is not None:
+            self._unindex_position(mac_address, info.get("grid_position"))
+            info["grid_position"] = position
+            self._pos_to_mac[position] = mac_address
             self.save()
             return True
         return False
@@ -146,6 +239,28 @@ class ConfigManager:
     def get_scan_timeout(self) -> int:
         """Get BLE scan timeout in seconds."""
         return self.config.get("scan_timeout", 20)
+    
+    def get_scan_service_filter(self) -> bool:
+        """Whether scans pre-filter on the display service UUID (names are always checked)."""
+        return self.config.get("scan_service_filter", False)
+    
+    # GATT Cache
+    def get_gatt_cache(self, mac_address: str) -> Optional[Dict]:
+        """Get the cached characteristic handle and MTU for a display."""
+        return self.config.get("gatt_cache", {}).get(mac_address)
+    
+    def set_gatt_cache(self, mac_address: str, char_handle: int, mtu: int) -> None:
+        """Record a display's characteristic handle and MTU (saves only on change)."""
+        entry = {"char_handle": char_handle, "mtu": mtu}
+        cache = self.config.setdefault("gatt_cache", {})
+        if cache.get(mac_address) != entry:
+            cache[mac_address] = entry
+            self.save()
+    
+    def clear_gatt_cache(self, mac_address: str) -> None:
+        """Forget a display's cached GATT layout so the next connect rediscovers."""
+        if self.config.get("gatt_cache", {}).pop(mac_address, None) is not None:
+            self.save()
 
 
 # Singleton instance
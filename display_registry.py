@@ -4,18 +4,37 @@ Manages runtime state of multiple displays and grid mapping.
 """
 
 import asyncio
+import functools
 from dataclasses import dataclass, field
-from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from enum import IntEnum
+from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime
 
+import numpy as np
+
+@functools.lru_cache(maxsize=64)
+def solid_frame(r: int, g: int, b: int) -> bytes:
+    """
+    Get a shared, immutable 16x16 frame of one color as packed RGB bytes.
+    Repeated clears/fills of the same color reuse one object.
+    """
+    return bytes((r & 0xFF, g & 0xFF, b & 0xFF)) * 256
 
-class DisplayState(Enum):
-    """Connection state for a display."""
-    DISCONNECTED = "disconnected"
-    CONNECTING = "connecting"
-    CONNECTED = "connected"
-    ERROR = "error"
+
+# Content hash of an all-black frame (the initial buffer contents)
+_BLACK_FRAME_HASH = hash(solid_frame(0, 0, 0))
+
+
+class DisplayState(IntEnum):
+    """
+    Connection state for a display. Int-valued so state checks are integer
+    compares and the value fits the registry's int8 state array; the API
+    reports the lowercase name.
+    """
+    DISCONNECTED = 0
+    CONNECTING = 1
+    CONNECTED = 2
+    ERROR = 3
 
 
 @dataclass
@@ -29,28 +48,83 @@ class DisplayInfo:
     error_message: Optional[str] = None
     client: Optional[object] = None  # BleakClient when connected
     
-    # Pixel buffer for this display (16x16 = 256 pixels, RGB)
-    pixel_buffer: List[Tuple[int, int, int]] = field(
-        default_factory=lambda: [(0, 0, 0)] * 256
+    # Pixel buffer for this display (16x16 = 256 pixels, RGB), allocated
+    # once and overwritten in place on every frame
+    pixel_buffer: np.ndarray = field(
+        default_factory=lambda: np.zeros((256, 3), dtype=np.uint8)
     )
-    buffer_dirty: bool = False  # True if buffer needs to be sent
+    buffer_dirty: bool = False  # True if buffer may differ from last sent frame
+    # Content hash of pixel_buffer; None after pixel edits until the next
+    # frame_bytes() call, so single-pixel writes never rehash the frame
+    buffer_hash: Optional[int] = _BLACK_FRAME_HASH
+    last_sent_hash: int = 0  # Content hash of last frame sent (0 = never)
+    last_sent: Optional[bytes] = None  # Last frame sent, packed RGB (None = unknown)
+    
+    # Slot in the registry's parallel arrays (-1 = not registered)
+    _slot: int = field(default=-1, init=False, repr=False, compare=False)
+    
+    # Flat byte view of pixel_buffer for per-pixel stores (rebound with it)
+    _flat: Optional[memoryview] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    # Memoized to_dict() result; cleared by the registry on any change
+    _dict_cache: Optional[Dict] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    # (buffer_hash, wire bytes) of the last frame_bytes() result
+    _frame_cache: Optional[Tuple[int, bytes]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self):
+        self._flat = memoryview(self.pixel_buffer).cast('B')
     
     def to_dict(self) -> Dict:
-        """Convert to JSON-serializable dict."""
-        return {
-            "mac_address": self.mac_address,
-            "name": self.name,
-            "state": self.state.value,
-            "grid_position": self.grid_position,
-            "last_connected": self.last_connected.isoformat() if self.last_connected else None,
-            "error_message": self.error_message
-        }
+        """
+        Convert to JSON-serializable dict.
+        The result is cached and shared between callers; do not mutate it.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "mac_address": self.mac_address,
+                "name": self.name,
+                "state": self.state.name.lower(),
+                "grid_position": self.grid_position,
+                "last_connected": self.last_connected.isoformat() if self.last_connected else None,
+                "error_message": self.error_message
+            }
+        return self._dict_cache
+    
+    def frame_bytes(self) -> bytes:
+        """
+        Get the buffer as 768 packed RGB bytes, the device's wire order.
+        Serialized (and hashed, after pixel edits) once per distinct frame.
+        """
+        cache = self._frame_cache
+        if cache is None or cache[0] != self.buffer_hash:
+            frame = self.pixel_buffer.tobytes()
+            self.buffer_hash = hash(frame)
+            cache = self._frame_cache = (self.buffer_hash, frame)
+        return cache[1]
+    
+    def invalidate_cache(self) -> None:
+        """Drop the memoized to_dict() after a status field changed."""
+        self._dict_cache = None
 
 
 class DisplayRegistry:
     """
     Registry tracking all known displays and their runtime state.
     Supports 4x4 grid (16 displays) for future expansion.
+    
+    Hot per-display fields live in parallel arrays indexed by slot
+    (struct-of-arrays): every DisplayInfo.pixel_buffer is a view into one
+    contiguous (slots, 256, 3) array, and state/dirty flags are mirrored
+    into arrays so the update loop can filter displays without touching
+    each object. The registry is the only writer of DisplayInfo.state and
+    DisplayInfo.buffer_dirty, which keeps both copies in step.
     """
     
     # Grid constants
@@ -58,10 +132,127 @@ class DisplayRegistry:
     GRID_COLS = 4
     PIXELS_PER_DISPLAY = 16
     
+    # Initial slot count (one per grid position); grows by doubling
+    INITIAL_SLOTS = 16
+    
     def __init__(self):
+        # Both maps are only mutated from the BLE event loop thread; the
+        # lock just keeps them consistent with each other across awaits.
+        # Single-field updates (state, client) rely on atomic attribute
+        # writes and take no lock, so status reads never queue behind them.
         self._displays: Dict[str, DisplayInfo] = {}  # MAC -> DisplayInfo
         self._position_map: Dict[int, str] = {}  # position -> MAC
         self._lock = asyncio.Lock()
+        
+        # Parallel per-slot arrays (see class docstring)
+        self._infos: List[Optional[DisplayInfo]] = [None] * self.INITIAL_SLOTS
+        self._buffers = np.zeros((self.INITIAL_SLOTS, 256, 3), dtype=np.uint8)
+        self._state = np.zeros(self.INITIAL_SLOTS, dtype=np.int8)
+        self._dirty = np.zeros(self.INITIAL_SLOTS, dtype=np.bool_)
+        
+        # Push notifications of displays becoming dirty (see dirty_queue());
+        # _queued dedupes MACs already waiting in the queue
+        self._dirty_queue: Optional[asyncio.Queue] = None
+        self._dirty_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queued: Set[str] = set()
+        
+        # Bumped on every status/layout change; guards the grid snapshot
+        self._version = 0
+        self._grid_cache: Optional[List[List[Optional[Dict]]]] = None
+        self._grid_cache_version = -1
+    
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever display status or layout changes."""
+        return self._version
+    
+    def _allocate_slot(self, display: DisplayInfo) -> None:
+        """Give a new display a slot and back its buffer with the shared array."""
+        try:
+            slot = self._infos.index(None)
+        except ValueError:
+            slot = len(self._infos)
+            self._grow(2 * slot)
+        
+        self._infos[slot] = display
+        self._buffers[slot] = display.pixel_buffer
+        self._state[slot] = display.state
+        self._dirty[slot] = display.buffer_dirty
+        display._slot = slot
+        self._bind_buffer(display, self._buffers[slot])
+    
+    def _grow(self, capacity: int) -> None:
+        """Enlarge the slot arrays and re-point display buffers at them."""
+        extra = capacity - len(self._infos)
+        self._infos.extend([None] * extra)
+        self._buffers = np.concatenate(
+            [self._buffers, np.zeros((extra, 256, 3), dtype=np.uint8)]
+        )
+        self._state = np.concatenate([self._state, np.zeros(extra, dtype=np.int8)])
+        self._dirty = np.concatenate([self._dirty, np.zeros(extra, dtype=np.bool_)])
+        for display in self._infos:
+            if display is not None:
+                self._bind_buffer(display, self._buffers[display._slot])
+    
+    def _release_slot(self, display: DisplayInfo) -> None:
+        """Free a display's slot; its buffer becomes a private copy."""
+        slot = display._slot
+        self._bind_buffer(display, self._buffers[slot].copy())
+        self._infos[slot] = None
+        self._state[slot] = 0
+        self._dirty[slot] = False
+        display._slot = -1
+    
+    @staticmethod
+    def _bind_buffer(display: DisplayInfo, buffer: np.ndarray) -> None:
+        """Point a display at a new pixel buffer and its flat byte view."""
+        display.pixel_buffer = buffer
+        display._flat = memoryview(buffer).cast('B')
+    
+    def _set_dirty(self, display: DisplayInfo, dirty: bool) -> None:
+        """Set a display's dirty flag and its array mirror."""
+        display.buffer_dirty = dirty
+        self._dirty[display._slot] = dirty
+        if dirty and self._dirty_queue is not None:
+            self._notify_dirty(display.mac_address)
+    
+    def _notify_dirty(self, mac_address: str) -> None:
+        """Queue a dirty MAC for the consumer loop; safe from any thread."""
+        if mac_address in self._queued:
+            return
+        self._queued.add(mac_address)
+        try:
+            on_loop = asyncio.get_running_loop() is self._dirty_loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            self._dirty_queue.put_nowait(mac_address)
+        else:
+            # Buffer writes also come from HTTP threads
+            self._dirty_loop.call_soon_threadsafe(
+                self._dirty_queue.put_nowait, mac_address)
+    
+    def dirty_queue(self) -> asyncio.Queue:
+        """
+        Get the queue of MACs whose buffers became dirty, creating it on
+        first use. Call from the event loop that will consume it.
+        """
+        if self._dirty_queue is None:
+            self._dirty_loop = asyncio.get_running_loop()
+            self._dirty_queue = asyncio.Queue()
+        return self._dirty_queue
+    
+    async def next_dirty(self) -> str:
+        """Wait for the next display to become dirty; returns its MAC."""
+        mac_address = await self.dirty_queue().get()
+        self._queued.discard(mac_address)
+        return mac_address
+    
+    def _changed(self, display: Optional[DisplayInfo] = None) -> None:
+        """Record a status/layout change (and drop the display's cached dict)."""
+        self._version += 1
+        if display is not None:
+            display.invalidate_cache()
     
     async def register_display(self, mac_address: str, name: str = "",
                                 grid_position: Optional[int] = None) -> DisplayInfo:
@@ -73,27 +264,39 @@ class DisplayRegistry:
             name: Human-readable name
             grid_position: Optional grid position (0-15)
         """
-        async with self._lock:
-            if mac_address in self._displays:
-                display = self._displays[mac_address]
-                if name:
-                    display.name = name
-                if grid_position is not None:
-                    self._update_position(mac_address, grid_position)
-            else:
-                display = DisplayInfo(
-                    mac_address=mac_address,
-                    name=name or f"Display_{len(self._displays)}",
-                    grid_position=grid_position
-                )
-                self._displays[mac_address] = display
-                if grid_position is not None:
-                    self._position_map[grid_position] = mac_address
-            
+        display = self._displays.get(mac_address)
+        if display is not None:
+            if name and name != display.name:
+                display.name = name
+                self._changed(display)
+            if grid_position is not None:
+                async with self._lock:
+                    self.update_position(mac_address, grid_position)
             return display
+        
+        # Build outside the lock; only the map updates need it
+        display = DisplayInfo(
+            mac_address=mac_address,
+            name=name or f"Display_{len(self._displays)}",
+            grid_position=grid_position
+        )
+        async with self._lock:
+            # setdefault: a concurrent registration of the same MAC wins
+            display = self._displays.setdefault(mac_address, display)
+            if display._slot < 0:
+                self._allocate_slot(display)
+            if display.grid_position is not None:
+                self._position_map[display.grid_position] = mac_address
+            self._changed()
+        
+        return display
     
-    def _update_position(self, mac_address: str, position: int) -> None:
-        """Update grid position for a display (must hold lock)."""
+    def update_position(self, mac_address: str, position: int) -> None:
+        """
+        Update grid position for a display.
+        Synchronous and await-free, so it runs atomically on the event loop
+        without taking the lock.
+        """
         if position < 0 or position > 15:
             raise ValueError("Grid position must be 0-15")
         
@@ -107,11 +310,13 @@ class DisplayRegistry:
             old_mac = self._position_map[position]
             if old_mac in self._displays:
                 self._displays[old_mac].grid_position = None
+                self._changed(self._displays[old_mac])
         
         # Set new position
         self._position_map[position] = mac_address
         if display:
             display.grid_position = position
+        self._changed(display)
     
     async def unregister_display(self, mac_address: str) -> bool:
         """Remove a display from the registry."""
@@ -121,6 +326,8 @@ class DisplayRegistry:
                 if display.grid_position is not None:
                     self._position_map.pop(display.grid_position, None)
                 del self._displays[mac_address]
+                self._release_slot(display)
+                self._changed()
                 return True
             return False
     
@@ -146,25 +353,30 @@ class DisplayRegistry:
     
     def get_connected_displays(self) -> List[DisplayInfo]:
         """Get all connected displays."""
-        return [d for d in self._displays.values() 
-                if d.state == DisplayState.CONNECTED]
+        return [self._infos[i] for i in
+                np.flatnonzero(self._state == DisplayState.CONNECTED)]
     
     async def set_state(self, mac_address: str, state: DisplayState,
                         error_message: Optional[str] = None) -> None:
         """Update display connection state."""
-        async with self._lock:
-            if mac_address in self._displays:
-                display = self._displays[mac_address]
-                display.state = state
-                display.error_message = error_message
-                if state == DisplayState.CONNECTED:
-                    display.last_connected = datetime.now()
+        display = self._displays.get(mac_address)
+        if display:
+            display.state = state
+            self._state[display._slot] = state
+            display.error_message = error_message
+            if state == DisplayState.CONNECTED:
+                display.last_connected = datetime.now()
+                # Fresh connection: device contents are unknown, resend all
+                display.last_sent = None
+                display.last_sent_hash = 0
+                self._set_dirty(display, True)
+            self._changed(display)
     
     async def set_client(self, mac_address: str, client: object) -> None:
         """Store BleakClient reference for connected display."""
-        async with self._lock:
-            if mac_address in self._displays:
-                self._displays[mac_address].client = client
+        display = self._displays.get(mac_address)
+        if display:
+            display.client = client
     
     # Pixel Buffer Operations
     def set_pixel(self, mac_address: str, x: int, y: int, 
@@ -179,38 +391,223 @@ class DisplayRegistry:
         """
         display = self._displays.get(mac_address)
         if display and 0 <= x < 16 and 0 <= y < 16:
-            index = y * 16 + x
-            display.pixel_buffer[index] = (r & 0xFF, g & 0xFF, b & 0xFF)
-            display.buffer_dirty = True
+            # Same store as write_pixel(), inlined for the per-request path
+            flat = display._flat
+            i = (y * 16 + x) * 3
+            flat[i] = r & 0xFF
+            flat[i + 1] = g & 0xFF
+            flat[i + 2] = b & 0xFF
+            display.buffer_hash = None
+            if not display.buffer_dirty:
+                self._set_dirty(display, True)
             return True
         return False
     
-    def set_image(self, mac_address: str, pixels: List[Tuple[int, int, int]]) -> bool:
+    def write_pixel(self, display: DisplayInfo, index: int,
+                    r: int, g: int, b: int) -> None:
+        """
+        Store one pixel by flat buffer index, skipping the MAC lookup and
+        bounds checks. Caller guarantees 0 <= index < 256 and byte colors.
+        Only flags the display dirty; the frame is compared with what was
+        last sent once, at send time.
+        """
+        flat = display._flat
+        i = index * 3
+        flat[i] = r
+        flat[i + 1] = g
+        flat[i + 2] = b
+        display.buffer_hash = None  # Inlined _mark_edited()
+        if not display.buffer_dirty:
+            self._set_dirty(display, True)
+    
+    def _mark_edited(self, display: DisplayInfo) -> None:
+        """Flag an in-place buffer edit: hash unknown, display dirty."""
+        display.buffer_hash = None
+        if not display.buffer_dirty:
+            self._set_dirty(display, True)
+    
+    def _set_pixel_unchecked(self, idx: int, pos: int,
+                             r: int, g: int, b: int) -> bool:
+        """
+        Set a pixel on the display at grid position pos by flat index.
+        For trusted internal callers that already validated idx (0-255)
+        and masked the color; no bounds checks are repeated here.
+        """
+        display = self.get_display_by_position(pos)
+        if display:
+            self.write_pixel(display, idx, r, g, b)
+            return True
+        return False
+    
+    def set_pixels(self, mac_address: str, pixels: np.ndarray) -> int:
+        """
+        Set many pixels in the display's buffer in one pass.
+        
+        Args:
+            mac_address: Display MAC address
+            pixels: (N, 5) integer array of x, y, r, g, b rows
+            
+        Returns:
+            Number of in-range pixels written
+        """
+        display = self._displays.get(mac_address)
+        if not display:
+            return 0
+        
+        pixels = np.asarray(pixels, dtype=np.int64).reshape(-1, 5)
+        xs, ys = pixels[:, 0], pixels[:, 1]
+        valid = pixels[(xs >= 0) & (xs < 16) & (ys >= 0) & (ys < 16)]
+        
+        # Scatter all rows in one vectorized store; the uint8 cast wraps
+        # colors modulo 256 in C, so no separate mask pass is needed
+        if len(valid):
+            display.pixel_buffer[valid[:, 1] * 16 + valid[:, 0]] = (
+                valid[:, 2:].astype(np.uint8))
+            self._mark_edited(display)
+        return len(valid)
+    
+    def set_region(self, mac_address: str, start: int, rgb: bytes) -> bool:
+        """
+        Paint a run of consecutive pixels (row-major) from packed RGB bytes.
+        
+        Args:
+            mac_address: Display MAC address
+            start: Index of the first pixel (0-255)
+            rgb: Packed RGB bytes, 3 per pixel; must fit in the buffer
+        """
+        display = self._displays.get(mac_address)
+        count, rem = divmod(len(rgb), 3)
+        if not display or rem or not 0 <= start <= 256 - count:
+            return False
+        
+        if count:
+            display._flat[start * 3:(start + count) * 3] = rgb
+            self._mark_edited(display)
+        return True
+    
+    def set_image(self, mac_address: str, pixels) -> bool:
         """
         Set entire 16x16 image for display.
         
         Args:
             mac_address: Display MAC address
-            pixels: List of 256 (r, g, b) tuples in row-major order
+            pixels: (256, 3) uint8 array, list of 256 (r, g, b) tuples
+                    in row-major order, or 768 packed RGB bytes
         """
         display = self._displays.get(mac_address)
-        if display and len(pixels) == 256:
-            display.pixel_buffer = [
-                (p[0] & 0xFF, p[1] & 0xFF, p[2] & 0xFF) 
-                for p in pixels
-            ]
-            display.buffer_dirty = True
-            return True
-        return False
+        if not display:
+            return False
+        
+        if isinstance(pixels, bytes):
+            return self._set_frame_bytes(display, pixels)
+        
+        pixels = np.asarray(pixels)
+        if pixels.ndim != 2 or pixels.shape[0] != 256 or pixels.shape[1] < 3:
+            return False
+        
+        pixels = pixels[:, :3]
+        if pixels.dtype != np.uint8:
+            # Cast wraps modulo 256, same as masking each channel with 0xFF
+            pixels = pixels.astype(np.uint8)
+        
+        self._store_frame(display, pixels)
+        return True
+    
+    def set_image_from_array(self, mac_address: str, pixels: np.ndarray) -> bool:
+        """
+        Set entire 16x16 image from a trusted array, skipping validation.
+        
+        Args:
+            mac_address: Display MAC address
+            pixels: uint8 array of 256 RGB pixels, shaped (256, 3) or
+                    (16, 16, 3); contiguous input avoids a copy when hashing
+        """
+        display = self._displays.get(mac_address)
+        if not display:
+            return False
+        
+        self._store_frame(display, pixels.reshape(256, 3))
+        return True
+    
+    def _store_frame(self, display: DisplayInfo, pixels: np.ndarray) -> None:
+        """Copy a (256, 3) uint8 frame into the buffer if its content changed."""
+        # Identical to the buffered frame: skip the copy
+        frame_hash = hash(pixels.tobytes())
+        if frame_hash != display.buffer_hash:
+            np.copyto(display.pixel_buffer, pixels)
+            display.buffer_hash = frame_hash
+        # Only dirty if it differs from what the device last received
+        self._set_dirty(display, frame_hash != display.last_sent_hash)
+    
+    def _set_frame_bytes(self, display: DisplayInfo, frame: bytes) -> bool:
+        """
+        Set a frame given as packed RGB bytes. bytes objects cache their
+        hash, so a shared constant frame (see solid_frame()) is hashed once,
+        and is reused as-is for the BLE payload instead of reserializing.
+        """
+        if len(frame) != 256 * 3:
+            return False
+        
+        frame_hash = hash(frame)
+        if frame_hash != display.buffer_hash:
+            display.pixel_buffer[:] = np.frombuffer(frame, dtype=np.uint8).reshape(256, 3)
+            display.buffer_hash = frame_hash
+            display._frame_cache = (frame_hash, frame)
+        self._set_dirty(display, frame_hash != display.last_sent_hash)
+        return True
     
     def get_dirty_displays(self) -> List[DisplayInfo]:
-        """Get displays with pending pixel updates."""
-        return [d for d in self._displays.values() if d.buffer_dirty]
+        """
+        Get displays with pending pixel updates. Displays whose edits put
+        back exactly the last sent frame are cleaned here instead.
+        """
+        dirty = []
+        for i in np.flatnonzero(self._dirty):
+            display = self._infos[i]
+            display.frame_bytes()  # Resolves buffer_hash after pixel edits
+            if display.buffer_hash == display.last_sent_hash:
+                self._set_dirty(display, False)
+            else:
+                dirty.append(display)
+        return dirty
+    
+    def clear_dirty_flag(self, mac_address: str,
+                         frame: Optional[bytes] = None) -> None:
+        """
+        Mark display buffer as sent.
+        
+        Args:
+            mac_address: Display MAC address
+            frame: Packed RGB frame that was actually sent (default: the
+                   current buffer); edits made during the send stay dirty
+        """
+        display = self._displays.get(mac_address)
+        if display:
+            if frame is None:
+                frame = display.frame_bytes()
+            display.last_sent = frame
+            display.last_sent_hash = hash(frame)
+            self._set_dirty(display, display.buffer_hash != display.last_sent_hash)
+    
+    def mark_sent(self, mac_address: str, frame: bytes) -> None:
+        """
+        Record a frame sent outside the update loop as the display's contents.
+        The dirty flag is left alone: the buffer still decides what the
+        update loop sends next.
+        """
+        display = self._displays.get(mac_address)
+        if display:
+            display.last_sent = frame
+            display.last_sent_hash = hash(frame)
     
-    def clear_dirty_flag(self, mac_address: str) -> None:
-        """Mark display buffer as sent."""
-        if mac_address in self._displays:
-            self._displays[mac_address].buffer_dirty = False
+    def mark_pixel_sent(self, mac_address: str, index: int,
+                        r: int, g: int, b: int) -> None:
+        """Patch one pixel sent outside the update loop into the last sent frame."""
+        display = self._displays.get(mac_address)
+        if display and display.last_sent is not None:
+            sent = bytearray(display.last_sent)
+            sent[index * 3:index * 3 + 3] = (r, g, b)
+            self.mark_sent(mac_address, bytes(sent))
     
     # Grid Utilities
     @staticmethod
@@ -227,23 +624,27 @@ class DisplayRegistry:
         """
         Get 4x4 grid status for visualization.
         Returns 2D array with display info or None for empty positions.
+        The snapshot is reused until the registry version changes.
         """
+        if self._grid_cache_version == self._version:
+            return self._grid_cache
+        
+        version = self._version
         grid = [[None for _ in range(4)] for _ in range(4)]
-        for pos, mac in self._position_map.items():
+        for pos, mac in list(self._position_map.items()):
             row, col = self.position_to_coords(pos)
             display = self._displays.get(mac)
             if display:
                 grid[row][col] = display.to_dict()
+        self._grid_cache, self._grid_cache_version = grid, version
         return grid
 
 
-# Singleton instance
-_registry: Optional[DisplayRegistry] = None
+# Singleton instance; registry and grid manager are in-memory only, so
+# both are built at import
+_registry = DisplayRegistry()
 
 
 def get_registry() -> DisplayRegistry:
-    """Get or create singleton DisplayRegistry instance."""
-    global _registry
-    if _registry is None:
-        _registry = DisplayRegistry()
+    """Get singleton DisplayRegistry instance."""
     return _registry
@@ -28,14 +28,9 @@ def load_and_resize_image(image_path):
         if img.mode != 'RGB':
             img = img.convert('RGB')
         
-        # Extract RGB values for each pixel
-        picture = []
-        for y in range(16):
-            for x in range(16):
-                r, g, b = img.getpixel((x, y))
-                picture.append((r, g, b))
-        
-        return picture
+        # Extract all RGB values in one pass over the packed raster
+        data = img.tobytes()
+        return list(zip(data[0::3], data[1::3], data[2::3]))
     
     except Exception as e:
         print(f"Error loading image: {e}")
@@ -7,7 +7,24 @@ from typing import Dict, List, Optional, Tuple
 from PIL import Image
 import io
 
-from display_registry import get_registry, DisplayInfo
+import numpy as np
+
+from display_registry import get_registry, solid_frame, DisplayInfo, DisplayState
+
+# Fixed 4x4 grid of 16x16 displays; tiles are a power of two, so local
+# coordinates are just the low 4 bits of the global ones (& 15)
+_TILE_SIZE = 16
+_TILE_MASK = _TILE_SIZE - 1
+
+# position -> (start_x, start_y) of that display's tile in the 64x64 grid
+_TILE_ORIGINS: Tuple[Tuple[int, int], ...] = tuple(
+    (p % 4 * _TILE_SIZE, p // 4 * _TILE_SIZE) for p in range(16)
+)
+
+# [gy, gx] -> display position owning that global pixel
+_PIXEL_TO_TILE = np.empty((64, 64), dtype=np.uint8)
+for _pos, (_sx, _sy) in enumerate(_TILE_ORIGINS):
+    _PIXEL_TO_TILE[_sy:_sy + _TILE_SIZE, _sx:_sx + _TILE_SIZE] = _pos
 
 
 class GridManager:
@@ -36,11 +53,15 @@ class GridManager:
     
     def __init__(self):
         self.registry = get_registry()
-        # Buffer for full 64x64 grid
-        self._grid_buffer: List[List[Tuple[int, int, int]]] = [
-            [(0, 0, 0) for _ in range(self.TOTAL_WIDTH)]
-            for _ in range(self.TOTAL_HEIGHT)
-        ]
+        # Buffer for full 64x64 grid, indexed [y, x, channel]
+        self._grid_buffer = np.zeros(
+            (self.TOTAL_HEIGHT, self.TOTAL_WIDTH, 3), dtype=np.uint8
+        )
+        # Flat byte view of the grid buffer for single-pixel stores
+        self._grid_flat = memoryview(self._grid_buffer).cast('B')
+        # Tile-major copy of the grid, [position, y, x, channel]; reused
+        # by every _distribute_to_displays() call
+        self._tile_out = np.empty((16, _TILE_SIZE, _TILE_SIZE, 3), dtype=np.uint8)
     
     # ==================== Coordinate Mapping ====================
     
@@ -57,16 +78,7 @@ class GridManager:
         if not (0 <= gx < self.TOTAL_WIDTH and 0 <= gy < self.TOTAL_HEIGHT):
             raise ValueError(f"Coordinates ({gx}, {gy}) out of range")
         
-        # Determine which display (grid position)
-        display_col = gx // self.DISPLAY_WIDTH
-        display_row = gy // self.DISPLAY_HEIGHT
-        display_position = display_row * self.GRID_COLS + display_col
-        
-        # Local coordinates within display
-        local_x = gx % self.DISPLAY_WIDTH
-        local_y = gy % self.DISPLAY_HEIGHT
-        
-        return (display_position, local_x, local_y)
+        return (int(_PIXEL_TO_TILE[gy, gx]), gx & _TILE_MASK, gy & _TILE_MASK)
     
     def display_to_global(self, position: int, lx: int, ly: int) -> Tuple[int, int]:
         """
@@ -79,13 +91,8 @@ class GridManager:
         Returns:
             (global_x, global_y)
         """
-        display_row = position // self.GRID_COLS
-        display_col = position % self.GRID_COLS
-        
-        global_x = display_col * self.DISPLAY_WIDTH + lx
-        global_y = display_row * self.DISPLAY_HEIGHT + ly
-        
-        return (global_x, global_y)
+        start_x, start_y = _TILE_ORIGINS[position]
+        return (start_x + lx, start_y + ly)
     
     # ==================== Grid Buffer Operations ====================
     
@@ -99,13 +106,18 @@ class GridManager:
             r, g, b: Color values (0-255)
         """
         if 0 <= gx < self.TOTAL_WIDTH and 0 <= gy < self.TOTAL_HEIGHT:
-            self._grid_buffer[gy][gx] = (r & 0xFF, g & 0xFF, b & 0xFF)
+            r, g, b = r & 0xFF, g & 0xFF, b & 0xFF
+            flat = self._grid_flat
+            i = (gy * self.TOTAL_WIDTH + gx) * 3
+            flat[i] = r
+            flat[i + 1] = g
+            flat[i + 2] = b
             
-            # Also update the display's local buffer
-            pos, lx, ly = self.global_to_display(gx, gy)
-            display = self.registry.get_display_by_position(pos)
-            if display:
-                self.registry.set_pixel(display.mac_address, lx, ly, r, g, b)
+            # Write straight into the owning display's buffer; coordinates
+            # and color are already validated, so skip registry.set_pixel
+            self.registry._set_pixel_unchecked(
+                (gy & _TILE_MASK) * _TILE_SIZE + (gx & _TILE_MASK),
+                (gy >> 4) * self.GRID_COLS + (gx >> 4), r, g, b)
             
             return True
         return False
@@ -113,29 +125,27 @@ class GridManager:
     def get_global_pixel(self, gx: int, gy: int) -> Tuple[int, int, int]:
         """Get pixel from global grid buffer."""
         if 0 <= gx < self.TOTAL_WIDTH and 0 <= gy < self.TOTAL_HEIGHT:
-            return self._grid_buffer[gy][gx]
+            return tuple(self._grid_buffer[gy, gx].tolist())
         return (0, 0, 0)
     
     def clear_grid(self) -> None:
         """Clear entire grid to black."""
-        for y in range(self.TOTAL_HEIGHT):
-            for x in range(self.TOTAL_WIDTH):
-                self._grid_buffer[y][x] = (0, 0, 0)
+        self._grid_buffer.fill(0)
         
         # Mark all displays as dirty
+        black = solid_frame(0, 0, 0)
         for display in self.registry.get_all_displays():
-            self.registry.set_image(display.mac_address, [(0, 0, 0)] * 256)
+            self.registry.set_image(display.mac_address, black)
     
     def fill_grid(self, r: int, g: int, b: int) -> None:
         """Fill entire grid with solid color."""
         color = (r & 0xFF, g & 0xFF, b & 0xFF)
-        for y in range(self.TOTAL_HEIGHT):
-            for x in range(self.TOTAL_WIDTH):
-                self._grid_buffer[y][x] = color
+        self._grid_buffer[:] = color
         
         # Update all displays
+        frame = solid_frame(*color)
         for display in self.registry.get_all_displays():
-            self.registry.set_image(display.mac_address, [color] * 256)
+            self.registry.set_image(display.mac_address, frame)
     
     # ==================== Image Loading ====================
     
@@ -162,6 +172,20 @@ class GridManager:
             print(f"Failed to load image: {e}")
             return False
     
+    def load_rgb_bytes(self, rgb_data: bytes) -> bool:
+        """
+        Load raw 64x64 RGB bytes (row-major, 12288 bytes).
+        Skips image decoding entirely.
+        """
+        if len(rgb_data) != self.TOTAL_WIDTH * self.TOTAL_HEIGHT * 3:
+            return False
+        
+        self._grid_buffer[:] = np.frombuffer(rgb_data, dtype=np.uint8).reshape(
+            self.TOTAL_HEIGHT, self.TOTAL_WIDTH, 3
+        )
+        self._distribute_to_displays()
+        return True
+    
     def load_pil_image(self, img: Image.Image) -> bool:
         """
         Load PIL Image and distribute to grid displays.
@@ -169,15 +193,14 @@ class GridManager:
         Args:
             img: PIL Image object
         """
-        # Resize to 64x64
-        img = img.resize((self.TOTAL_WIDTH, self.TOTAL_HEIGHT))
+        # Resize to 64x64 (bilinear: SIMD-accelerated under Pillow-SIMD)
         img = img.convert('RGB')
+        if img.size != (self.TOTAL_WIDTH, self.TOTAL_HEIGHT):
+            img = img.resize((self.TOTAL_WIDTH, self.TOTAL_HEIGHT),
+                             Image.Resampling.BILINEAR)
         
-        # Update grid buffer
-        for y in range(self.TOTAL_HEIGHT):
-            for x in range(self.TOTAL_WIDTH):
-                pixel = img.getpixel((x, y))
-                self._grid_buffer[y][x] = (pixel[0], pixel[1], pixel[2])
+        # Update grid buffer (one copy of PIL's contiguous raster)
+        self._grid_buffer[:] = np.asarray(img, dtype=np.uint8)
         
         # Distribute to displays
         self._distribute_to_displays()
@@ -185,30 +208,23 @@ class GridManager:
     
     def _distribute_to_displays(self) -> None:
         """Distribute grid buffer to individual displays."""
+        # Split [row, y, col, x] into [row, col, y, x] tiles in one strided
+        # copy, so each display's 16x16 tile is contiguous
+        self._tile_out.reshape(
+            self.GRID_ROWS, self.GRID_COLS, _TILE_SIZE, _TILE_SIZE, 3
+        )[:] = self._grid_buffer.reshape(
+            self.GRID_ROWS, _TILE_SIZE, self.GRID_COLS, _TILE_SIZE, 3
+        ).transpose(0, 2, 1, 3, 4)
+        
         for position in range(16):
             display = self.registry.get_display_by_position(position)
-            if not display:
-                continue
-            
-            # Extract 16x16 region for this display
-            pixels: List[Tuple[int, int, int]] = []
-            display_row = position // self.GRID_COLS
-            display_col = position % self.GRID_COLS
-            
-            start_y = display_row * self.DISPLAY_HEIGHT
-            start_x = display_col * self.DISPLAY_WIDTH
-            
-            for ly in range(self.DISPLAY_HEIGHT):
-                for lx in range(self.DISPLAY_WIDTH):
-                    gx = start_x + lx
-                    gy = start_y + ly
-                    pixels.append(self._grid_buffer[gy][gx])
-            
-            self.registry.set_image(display.mac_address, pixels)
+            if display:
+                self.registry.set_image_from_array(display.mac_address,
+                                                   self._tile_out[position])
     
     # ==================== Display Region Extraction ====================
     
-    def get_display_pixels(self, position: int) -> List[Tuple[int, int, int]]:
+    def get_display_pixels(self, position: int) -> np.ndarray:
         """
         Get 16x16 pixel array for a specific display position.
         
@@ -216,22 +232,12 @@ class GridManager:
             position: Grid position (0-15)
             
         Returns:
-            List of 256 (r, g, b) tuples in row-major order
+            (256, 3) uint8 array of RGB values in row-major order
         """
-        pixels = []
-        display_row = position // self.GRID_COLS
-        display_col = position % self.GRID_COLS
-        
-        start_y = display_row * self.DISPLAY_HEIGHT
-        start_x = display_col * self.DISPLAY_WIDTH
-        
-        for ly in range(self.DISPLAY_HEIGHT):
-            for lx in range(self.DISPLAY_WIDTH):
-                gx = start_x + lx
-                gy = start_y + ly
-                pixels.append(self._grid_buffer[gy][gx])
-        
-        return pixels
+        start_x, start_y = _TILE_ORIGINS[position]
+        tile = self._grid_buffer[start_y:start_y + _TILE_SIZE,
+                                 start_x:start_x + _TILE_SIZE]
+        return tile.reshape(_TILE_SIZE * _TILE_SIZE, 3)
     
     # ==================== Update Scheduling ====================
     
@@ -240,12 +246,10 @@ class GridManager:
         Get list of display positions to update in order.
         Returns only positions with connected displays.
         """
-        order = []
-        for pos in range(16):
-            display = self.registry.get_display_by_position(pos)
-            if display and display.state.value == "connected":
-                order.append(pos)
-        return order
+        get_display = self.registry.get_display_by_position
+        return [pos for pos in range(16)
+                if (display := get_display(pos))
+                and display.state == DisplayState.CONNECTED]
     
     def get_update_schedule(self, interval_ms: int = 1000) -> Dict:
         """
@@ -269,12 +273,9 @@ class GridManager:
 
 
 # Singleton instance
-_grid_manager = None
+_grid_manager = GridManager()
 
 
 def get_grid_manager() -> GridManager:
-    """Get or create singleton GridManager instance."""
-    global _grid_manager
-    if _grid_manager is None:
-        _grid_manager = GridManager()
+    """Get singleton GridManager instance."""
     return _grid_manager
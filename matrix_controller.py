@@ -4,31 +4,37 @@ High-level interface for display operations with command queuing.
 """
 
 import asyncio
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
-from enum import Enum
-import time
+from typing import Awaitable, Callable, Dict, Final, List, NamedTuple, Optional
+from enum import IntEnum
 
-from display_registry import get_registry, DisplayInfo, DisplayState
+import numpy as np
+
+from display_registry import get_registry, solid_frame, DisplayInfo, DisplayState
 from rpi_bluetooth_manager import get_bluetooth_manager
 
+# Shared all-black frame for clears (immutable packed RGB bytes)
+_BLACK_FRAME: Final[bytes] = solid_frame(0, 0, 0)
+
+# Display power commands
+_POWER_ON: Final[bytes] = bytes.fromhex("bcff01ff55")
+_POWER_OFF: Final[bytes] = bytes.fromhex("bcff00ff55")
+
 
-class CommandType(Enum):
+class CommandType(IntEnum):
     """Types of display commands."""
-    SET_PIXEL = "set_pixel"
-    SET_IMAGE = "set_image"
-    CLEAR = "clear"
-    POWER_ON = "power_on"
-    POWER_OFF = "power_off"
+    SET_PIXEL = 0
+    SET_IMAGE = 1
+    CLEAR = 2
+    POWER_ON = 3
+    POWER_OFF = 4
 
 
-@dataclass
-class DisplayCommand:
-    """A queued command for a display."""
+class DisplayCommand(NamedTuple):
+    """A queued command for a display (tuple-backed, no per-instance dict)."""
     command_type: CommandType
     mac_address: str
     data: Dict
-    timestamp: float
+    timestamp: float = 0.0  # Optional; nothing schedules on it yet
     priority: int = 0  # Higher = more urgent
 
 
@@ -38,27 +44,45 @@ class MatrixController:
     Provides simple API for pixel/image operations with command batching.
     """
     
+    # Max queued commands; producers wait once this many are pending
+    COMMAND_QUEUE_SIZE = 256
+    
     def __init__(self):
         self.registry = get_registry()
         self.bt_manager = get_bluetooth_manager()
-        self._command_queue: asyncio.Queue[DisplayCommand] = asyncio.Queue()
+        self._command_queue: asyncio.Queue[DisplayCommand] = asyncio.Queue(
+            maxsize=self.COMMAND_QUEUE_SIZE
+        )
+        self._stop_event = asyncio.Event()
         self._running = False
         self._processor_task: Optional[asyncio.Task] = None
+        
+        # CommandType -> handler coroutine, built once
+        self._dispatch: Dict[CommandType, Callable[[DisplayCommand], Awaitable[None]]] = {
+            CommandType.SET_PIXEL: self._h_set_pixel,
+            CommandType.SET_IMAGE: self._h_set_image,
+            CommandType.CLEAR: self._h_clear,
+            CommandType.POWER_ON: self._h_power_on,
+            CommandType.POWER_OFF: self._h_power_off,
+        }
     
     # ==================== Lifecycle ====================
     
     async def start(self) -> None:
         """Start the controller and background processing."""
         self._running = True
+        self._stop_event.clear()
         self._processor_task = asyncio.create_task(self._process_commands())
         await self.bt_manager.start_update_loop()
     
     async def stop(self) -> None:
         """Stop the controller."""
         self._running = False
+        self._stop_event.set()
         await self.bt_manager.stop_update_loop()
         if self._processor_task:
-            self._processor_task.cancel()
+            await self._processor_task
+            self._processor_task = None
     
     # ==================== Discovery & Connection ====================
     
@@ -132,27 +156,50 @@ class MatrixController:
         """
         return self.registry.set_pixel(mac_address, x, y, r, g, b)
     
+    def set_pixels_batch(self, mac_address: str, pixels: np.ndarray) -> int:
+        """
+        Set many pixels on a display with a single buffer update.
+        
+        Args:
+            mac_address: Target display
+            pixels: (N, 5) integer array of x, y, r, g, b rows
+            
+        Returns:
+            Number of pixels set
+        """
+        return self.registry.set_pixels(mac_address, pixels)
+    
+    def set_region(self, mac_address: str, start: int, rgb: bytes) -> bool:
+        """
+        Paint consecutive pixels from packed RGB bytes in one buffer write.
+        
+        Args:
+            mac_address: Target display
+            start: First pixel index (0-255, row-major)
+            rgb: Packed RGB bytes, 3 per pixel
+        """
+        return self.registry.set_region(mac_address, start, rgb)
+    
     def set_pixel_by_position(self, position: int, x: int, y: int,
                                r: int, g: int, b: int) -> bool:
         """Set pixel on display at grid position."""
-        display = self.registry.get_display_by_position(position)
-        if display:
-            return self.registry.set_pixel(display.mac_address, x, y, r, g, b)
-        return False
+        if not (0 <= x < 16 and 0 <= y < 16):
+            return False
+        return self.registry._set_pixel_unchecked(
+            y * 16 + x, position, r & 0xFF, g & 0xFF, b & 0xFF)
     
-    def set_image(self, mac_address: str, 
-                  pixels: List[Tuple[int, int, int]]) -> bool:
+    def set_image(self, mac_address: str, pixels) -> bool:
         """
         Set full 16x16 image on a display.
         
         Args:
             mac_address: Target display
-            pixels: List of 256 (r, g, b) tuples in row-major order
+            pixels: (256, 3) uint8 array or list of 256 (r, g, b) tuples
+                    in row-major order
         """
         return self.registry.set_image(mac_address, pixels)
     
-    def set_image_by_position(self, position: int,
-                               pixels: List[Tuple[int, int, int]]) -> bool:
+    def set_image_by_position(self, position: int, pixels) -> bool:
         """Set image on display at grid position."""
         display = self.registry.get_display_by_position(position)
         if display:
@@ -161,13 +208,11 @@ class MatrixController:
     
     def clear_display(self, mac_address: str) -> bool:
         """Clear display to black."""
-        black_pixels = [(0, 0, 0)] * 256
-        return self.registry.set_image(mac_address, black_pixels)
+        return self.registry.set_image(mac_address, _BLACK_FRAME)
     
     def fill_display(self, mac_address: str, r: int, g: int, b: int) -> bool:
         """Fill display with solid color."""
-        color_pixels = [(r, g, b)] * 256
-        return self.registry.set_image(mac_address, color_pixels)
+        return self.registry.set_image(mac_address, solid_frame(r, g, b))
     
     # ==================== Direct Send (Bypass Buffer) ====================
     
@@ -180,14 +225,36 @@ class MatrixController:
         pixel_index = y * 16 + x
         return await self.bt_manager.send_pixel(mac_address, pixel_index, r, g, b)
     
-    async def send_image_now(self, mac_address: str,
-                              pixels: List[Tuple[int, int, int]]) -> bool:
-        """Send full image immediately."""
+    async def send_image_now(self, mac_address: str, pixels) -> bool:
+        """Send full image (packed RGB bytes or 256 tuples) immediately."""
         if not self.bt_manager.is_connected(mac_address):
             return False
         
         return await self.bt_manager.send_full_image(mac_address, pixels)
     
+    async def flush_frame(self) -> int:
+        """
+        Send every dirty, connected display's buffer in one parallel batch.
+        
+        Returns:
+            Number of displays successfully updated
+        """
+        dirty = [d for d in self.registry.get_dirty_displays()
+                 if self.bt_manager.is_connected(d.mac_address)]
+        frames = [d.frame_bytes() for d in dirty]
+        # One display raising must not abort the others' bookkeeping
+        results = await asyncio.gather(*(
+            self.bt_manager.send_full_image(d.mac_address, frame)
+            for d, frame in zip(dirty, frames)
+        ), return_exceptions=True)
+        
+        sent = 0
+        for display, frame, result in zip(dirty, frames, results):
+            if result is True:
+                self.registry.clear_dirty_flag(display.mac_address, frame)
+                sent += 1
+        return sent
+    
     # ==================== Grid Operations ====================
     
     def get_grid_status(self) -> List[List[Optional[Dict]]]:
@@ -195,14 +262,23 @@ class MatrixController:
         return self.registry.get_grid_status()
     
     def assign_to_grid(self, mac_address: str, position: int) -> bool:
-        """Assign display to grid position (0-15)."""
+        """
+        Assign display to grid position (0-15).
+        The position is updated before this returns.
+        """
         display = self.registry.get_display(mac_address)
         if display and 0 <= position <= 15:
-            asyncio.create_task(
-                self.registry.register_display(
-                    mac_address=mac_address,
-                    grid_position=position
-                )
+            self.registry.update_position(mac_address, position)
+            return True
+        return False
+    
+    async def assign_to_grid_async(self, mac_address: str, position: int) -> bool:
+        """Assign display to grid position (0-15) under the registry lock."""
+        display = self.registry.get_display(mac_address)
+        if display and 0 <= position <= 15:
+            await self.registry.register_display(
+                mac_address=mac_address,
+                grid_position=position
             )
             return True
         return False
@@ -210,38 +286,54 @@ class MatrixController:
     # ==================== Command Processing ====================
     
     async def _process_commands(self) -> None:
-        """Process queued commands."""
-        while self._running:
-            try:
-                command = await asyncio.wait_for(
-                    self._command_queue.get(), 
-                    timeout=0.1
+        """Process queued commands until stop() sets the stop event."""
+        stop_task = asyncio.ensure_future(self._stop_event.wait())
+        try:
+            while True:
+                get_task = asyncio.ensure_future(self._command_queue.get())
+                done, _ = await asyncio.wait(
+                    {get_task, stop_task},
+                    return_when=asyncio.FIRST_COMPLETED
                 )
-                await self._execute_command(command)
-            except asyncio.TimeoutError:
-                continue
+                if stop_task in done:
+                    get_task.cancel()
+                    break
+                await self._execute_command(get_task.result())
+        finally:
+            stop_task.cancel()
     
     async def _execute_command(self, cmd: DisplayCommand) -> None:
         """Execute a single command."""
-        mac = cmd.mac_address
-        
-        if cmd.command_type == CommandType.SET_PIXEL:
-            await self.send_pixel_now(
-                mac, 
-                cmd.data["x"], cmd.data["y"],
-                cmd.data["r"], cmd.data["g"], cmd.data["b"]
-            )
-        elif cmd.command_type == CommandType.SET_IMAGE:
-            await self.send_image_now(mac, cmd.data["pixels"])
-        elif cmd.command_type == CommandType.CLEAR:
-            await self.send_image_now(mac, [(0, 0, 0)] * 256)
-        elif cmd.command_type == CommandType.POWER_ON:
-            await self.bt_manager.send_command(mac, bytes.fromhex("bcff01ff55"))
-        elif cmd.command_type == CommandType.POWER_OFF:
-            await self.bt_manager.send_command(mac, bytes.fromhex("bcff00ff55"))
+        await self._dispatch[cmd.command_type](cmd)
+    
+    async def _h_set_pixel(self, cmd: DisplayCommand) -> None:
+        """Send a queued single-pixel update."""
+        data = cmd.data
+        await self.send_pixel_now(
+            cmd.mac_address,
+            data["x"], data["y"],
+            data["r"], data["g"], data["b"]
+        )
+    
+    async def _h_set_image(self, cmd: DisplayCommand) -> None:
+        """Send a queued full image."""
+        await self.send_image_now(cmd.mac_address, cmd.data["pixels"])
+    
+    async def _h_clear(self, cmd: DisplayCommand) -> None:
+        """Send a black frame."""
+        await self.send_image_now(cmd.mac_address, _BLACK_FRAME)
+    
+    async def _h_power_on(self, cmd: DisplayCommand) -> None:
+        """Turn the display on."""
+        await self.bt_manager.send_command(cmd.mac_address, _POWER_ON)
+    
+    async def _h_power_off(self, cmd: DisplayCommand) -> None:
+        """Turn the display off."""
+        await self.bt_manager.send_command(cmd.mac_address, _POWER_OFF)
 
 
-# Singleton instance
+# Singleton instance; built on first use, since it brings up the Bluetooth
+# and config managers (config file read, writer thread)
 _controller: Optional[MatrixController] = None
 
 
@@ -4,19 +4,81 @@ Handles BLE discovery, connection management, and auto-reconnection.
 """
 
 import asyncio
-import time
-from typing import Dict, List, Optional, Callable
+import functools
+import logging
+import random
+import struct
+import sys
+from typing import Dict, List, Optional, Callable, Set, Tuple
+
+import numpy as np
 from bleak import BleakScanner, BleakClient, BleakError
+from bleak.backends.characteristic import BleakGATTCharacteristic
 from bleak.backends.device import BLEDevice
 
 from display_registry import get_registry, DisplayState, DisplayInfo
 from config_manager import get_config_manager
 
+logger = logging.getLogger(__name__)
+
 # MI Matrix Display BLE UUIDs
 SERVICE_UUID = "0000ffd0-0000-1000-8000-00805f9b34fb"
 CHARACTERISTIC_UUID = "0000ffd1-0000-1000-8000-00805f9b34fb"
 DEVICE_NAME = "MI Matrix Display"
 
+# Fixed command payloads, parsed once at import
+_INIT_POWER_ON = bytes.fromhex("bc00010155")
+_INIT_GRAFFITI = bytes.fromhex("bc000d0d55")  # Enter graffiti (pixel) mode
+_IMG_START = bytes.fromhex("bc0ff1080855")
+_IMG_END = bytes.fromhex("bc0ff2080955")
+
+# Single-pixel command: BC 01 01 00 <idx> <r> <g> <b> <end idx> 55
+_PIXEL_CMD = struct.Struct(">10B")
+
+# Image block command: BC 0F <idx> + 32 RGB pixels + 55
+BLOCK_COMMAND_SIZE = 3 + 32 * 3 + 1
+# All 8 image blocks as one (8, 100) byte grid with headers and terminators
+# prefilled; a frame only fills the pixel columns [3:99]
+_IMG_BLOCKS = np.zeros((8, BLOCK_COMMAND_SIZE), dtype=np.uint8)
+_IMG_BLOCKS[:, 0] = 0xBC
+_IMG_BLOCKS[:, 1] = 0x0F
+_IMG_BLOCKS[:, 2] = np.arange(1, 9)
+_IMG_BLOCKS[:, -1] = 0x55
+# A write carries the negotiated ATT MTU minus this header
+ATT_HEADER_SIZE = 3
+
+# Cost of an unacknowledged write relative to an acknowledged one (a full
+# round trip); used to choose between per-pixel and full-image refreshes
+UNACKED_WRITE_COST = 0.25
+
+# Fallback connection check interval; drops are normally caught by the
+# disconnect callback right away
+WATCHDOG_INTERVAL = 60
+
+# Bleak's service cache (dangerous_use_bleak_cache) is a BlueZ-only option
+_IS_BLUEZ = sys.platform.startswith("linux")
+
+# Seconds between send throughput summaries in the debug log
+STATS_INTERVAL = 1.0
+
+# Pending send jobs per display; producers wait once this many are queued
+SEND_QUEUE_SIZE = 64
+
+# Connect retry backoff: base * 2^attempt seconds, capped, with +/-50% jitter
+RETRY_BACKOFF_BASE = 0.25
+RETRY_BACKOFF_CAP = 8.0
+
+
+class _SendJob:
+    """Writes that go out back to back on one display's writer task."""
+    
+    __slots__ = ("writes", "future")
+    
+    def __init__(self, writes: Tuple[Tuple[bytes, bool], ...],
+                 future: asyncio.Future):
+        self.writes = writes  # (data, response) pairs
+        self.future = future  # Resolves True once every write succeeded
+
 
 class BluetoothManager:
     """
@@ -28,12 +90,64 @@ class BluetoothManager:
         self.registry = get_registry()
         self.config = get_config_manager()
         self._clients: Dict[str, BleakClient] = {}  # MAC -> BleakClient
+        # MACs whose characteristic supports write-without-response
+        self._unacked_writes: Set[str] = set()
+        # MAC -> resolved command characteristic (skips UUID lookup per write)
+        self._chars: Dict[str, BleakGATTCharacteristic] = {}
+        # MAC -> bounded send queue drained by that display's writer task
+        self._send_queues: Dict[str, asyncio.Queue[_SendJob]] = {}
+        self._writer_tasks: Dict[str, asyncio.Task] = {}
+        # MAC -> queued image transfer not yet started (latest frame wins)
+        self._pending_images: Dict[str, _SendJob] = {}
         self._scan_callback: Optional[Callable] = None
         self._running = False
         self._update_task: Optional[asyncio.Task] = None
+        self._stats_task: Optional[asyncio.Task] = None
+        # Send counters, summarized and reset every STATS_INTERVAL
+        self._frames_sent = 0
+        self._bytes_sent = 0
+        self._reconnect_tasks: Dict[str, asyncio.Task] = {}  # MAC -> task
+        self._display_workers: Dict[str, asyncio.Task] = {}  # MAC -> refresh task
+        
+        # One shared scanner; scans subscribe to its advertisements
+        self._scanner: Optional[BleakScanner] = None
+        self._adv_subscribers: Set[Callable] = set()
+        self._scanner_lock = asyncio.Lock()  # Serializes scanner start/stop
     
     # ==================== Scanning ====================
     
+    async def _subscribe(self, callback: Callable) -> None:
+        """
+        Deliver new advertisements to callback, starting the shared scanner
+        if no other scan is running.
+        """
+        async with self._scanner_lock:
+            if self._scanner is None:
+                # Optionally pre-filter on the service UUID in the BLE
+                # stack; only works if the display advertises it
+                service_filter = self.config.get_scan_service_filter()
+                scanner = BleakScanner(
+                    self._on_advertisement,
+                    service_uuids=[SERVICE_UUID] if service_filter else None
+                )
+                await scanner.start()
+                self._scanner = scanner
+            self._adv_subscribers.add(callback)
+    
+    async def _unsubscribe(self, callback: Callable) -> None:
+        """Stop delivering advertisements to callback; the last one out stops the scanner."""
+        async with self._scanner_lock:
+            self._adv_subscribers.discard(callback)
+            if not self._adv_subscribers:
+                scanner, self._scanner = self._scanner, None
+                if scanner:
+                    await scanner.stop()
+    
+    def _on_advertisement(self, device: BLEDevice, advertisement_data) -> None:
+        """Shared scanner callback: fan out to all subscribers."""
+        for callback in tuple(self._adv_subscribers):
+            callback(device, advertisement_data)
+    
     async def scan_for_displays(self, timeout: int = None) -> List[BLEDevice]:
         """
         Scan for MI Matrix Display devices.
@@ -45,22 +159,26 @@ class BluetoothManager:
             List of discovered BLEDevice objects
         """
         timeout = timeout or self.config.get_scan_timeout()
-        found_devices: List[BLEDevice] = []
+        found: Dict[str, BLEDevice] = {}  # MAC -> device
         
+        # The optional service UUID filter only narrows what the stack
+        # reports; FFD0 is a generic vendor UUID, so always match the name
         def detection_callback(device: BLEDevice, advertisement_data):
+            if device.address in found:
+                return
             if device.name and DEVICE_NAME in device.name:
-                if device not in found_devices:
-                    found_devices.append(device)
-                    print(f"Found: {device.name} [{device.address}]")
-        
-        print(f"Scanning for {DEVICE_NAME} devices ({timeout}s)...")
-        scanner = BleakScanner(detection_callback)
+                found[device.address] = device
+                logger.debug("Found: %s [%s]", device.name, device.address)
         
-        await scanner.start()
-        await asyncio.sleep(timeout)
-        await scanner.stop()
+        logger.debug("Scanning for %s devices (%ss)...", DEVICE_NAME, timeout)
+        try:
+            await self._subscribe(detection_callback)
+            await asyncio.sleep(timeout)
+        finally:
+            await self._unsubscribe(detection_callback)
         
         # Register discovered devices
+        found_devices = list(found.values())
         for device in found_devices:
             await self.registry.register_display(
                 mac_address=device.address,
@@ -69,7 +187,7 @@ class BluetoothManager:
             # Also save to config for persistence
             self.config.add_display(device.address, device.name)
         
-        print(f"Found {len(found_devices)} display(s)")
+        logger.info("Found %d display(s)", len(found_devices))
         return found_devices
     
     async def quick_scan(self, known_address: str, timeout: int = 5) -> Optional[BLEDevice]:
@@ -78,20 +196,24 @@ class BluetoothManager:
         Uses cached MAC address for faster reconnection.
         """
         found_device = None
+        found = asyncio.Event()
+        known_address = known_address.upper()
         
         def detection_callback(device: BLEDevice, advertisement_data):
             nonlocal found_device
-            if device.address.upper() == known_address.upper():
+            if device.address.upper() == known_address:
                 found_device = device
+                found.set()
         
-        scanner = BleakScanner(detection_callback)
-        await scanner.start()
-        
-        start_time = time.time()
-        while found_device is None and (time.time() - start_time) < timeout:
-            await asyncio.sleep(0.1)
+        # Returns on the first matching advertisement
+        try:
+            await self._subscribe(detection_callback)
+            await asyncio.wait_for(found.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            await self._unsubscribe(detection_callback)
         
-        await scanner.stop()
         return found_device
     
     # ==================== Connection ====================
@@ -113,22 +235,41 @@ class BluetoothManager:
         
         for attempt in range(retry_count):
             try:
-                print(f"Connecting to {mac_address} (attempt {attempt + 1}/{retry_count})...")
+                logger.debug("Connecting to %s (attempt %d/%d)...",
+                             mac_address, attempt + 1, retry_count)
                 
-                # Create client
-                client = BleakClient(mac_address)
-                await client.connect()
+                # Known display on BlueZ: reuse bleak's service cache instead
+                # of running GATT discovery again
+                cached = self.config.get_gatt_cache(mac_address) if _IS_BLUEZ else None
+                client = await self._open_client(mac_address, use_cache=bool(cached))
                 
                 if client.is_connected:
+                    await self._acquire_mtu(mac_address, client)
+                    if cached and not self._gatt_cache_matches(client, cached):
+                        # Stale layout or a different MTU: drop the entry and
+                        # rediscover right away, within this attempt
+                        logger.info("GATT cache stale for %s, rediscovering", mac_address)
+                        self.config.clear_gatt_cache(mac_address)
+                        await client.disconnect()
+                        client = await self._open_client(mac_address, use_cache=False)
+                        if not client.is_connected:
+                            continue
+                        await self._acquire_mtu(mac_address, client)
+                    
                     self._clients[mac_address] = client
+                    self._setup_writes(mac_address, client)
+                    self._start_writer(mac_address)
                     await self.registry.set_state(mac_address, DisplayState.CONNECTED)
                     await self.registry.set_client(mac_address, client)
-                    print(f"Connected to {mac_address}")
+                    logger.info("Connected to %s", mac_address)
                     return True
                     
             except BleakError as e:
-                print(f"Connection attempt {attempt + 1} failed: {e}")
-                await asyncio.sleep(1)
+                logger.warning("Connection attempt %d to %s failed: %s",
+                               attempt + 1, mac_address, e)
+                # Jitter spreads out displays retrying after the same outage
+                delay = min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * 2 ** attempt)
+                await asyncio.sleep(delay * random.uniform(0.5, 1.5))
         
         await self.registry.set_state(
             mac_address, 
@@ -137,18 +278,76 @@ class BluetoothManager:
         )
         return False
     
+    async def _open_client(self, mac_address: str, use_cache: bool) -> BleakClient:
+        """Create and connect a client; drops are reported via _on_disconnect."""
+        client = BleakClient(
+            mac_address,
+            disconnected_callback=functools.partial(self._on_disconnect, mac_address)
+        )
+        if use_cache:
+            await client.connect(dangerous_use_bleak_cache=True)
+        else:
+            await client.connect()
+        return client
+    
+    async def _acquire_mtu(self, mac_address: str, client: BleakClient) -> None:
+        """Measure the link MTU (BlueZ only reports the real value after acquiring it)."""
+        # Other backends negotiate on connect and expose it directly
+        acquire_mtu = getattr(getattr(client, "_backend", None), "_acquire_mtu", None)
+        if acquire_mtu:
+            try:
+                await acquire_mtu()
+            except Exception as e:
+                logger.warning("MTU exchange failed for %s: %s", mac_address, e)
+    
+    @staticmethod
+    def _gatt_cache_matches(client: BleakClient, cached: Dict) -> bool:
+        """Whether a cached GATT entry still describes this connection."""
+        char = client.services.get_characteristic(CHARACTERISTIC_UUID)
+        return (char is not None and char.handle == cached["char_handle"]
+                and client.mtu_size == cached["mtu"])
+    
+    def _setup_writes(self, mac_address: str, client: BleakClient) -> None:
+        """Pick the write mode for the measured MTU."""
+        char = client.services.get_characteristic(CHARACTERISTIC_UUID)
+        payload = client.mtu_size - ATT_HEADER_SIZE
+        
+        # Unacked writes cannot be split, so a block must fit in one packet
+        if char:
+            self._chars[mac_address] = char
+            # Record the layout; the MTU is kept to detect link changes
+            self.config.set_gatt_cache(mac_address, char.handle, client.mtu_size)
+        if (char and "write-without-response" in char.properties
+                and payload >= BLOCK_COMMAND_SIZE):
+            self._unacked_writes.add(mac_address)
+        
+        logger.debug("MTU %d for %s: %s image block writes", client.mtu_size,
+                     mac_address,
+                     "unacked" if mac_address in self._unacked_writes else "acked")
+    
     async def disconnect(self, mac_address: str) -> None:
         """Disconnect from a display."""
-        if mac_address in self._clients:
-            client = self._clients[mac_address]
+        # Forget the client first so its disconnect callback is ignored
+        client = self._forget(mac_address)
+        if client:
             try:
                 await client.disconnect()
             except BleakError:
                 pass
-            del self._clients[mac_address]
         
         await self.registry.set_state(mac_address, DisplayState.DISCONNECTED)
-        print(f"Disconnected from {mac_address}")
+        logger.info("Disconnected from %s", mac_address)
+    
+    def _forget(self, mac_address: str) -> Optional[BleakClient]:
+        """Drop all per-connection state for a display; returns its client."""
+        self._unacked_writes.discard(mac_address)
+        self._chars.pop(mac_address, None)
+        self._send_queues.pop(mac_address, None)
+        self._pending_images.pop(mac_address, None)
+        writer = self._writer_tasks.pop(mac_address, None)
+        if writer:
+            writer.cancel()
+        return self._clients.pop(mac_address, None)
     
     async def disconnect_all(self) -> None:
         """Disconnect from all displays."""
@@ -162,40 +361,136 @@ class BluetoothManager:
     
     # ==================== Commands ====================
     
-    async def send_command(self, mac_address: str, data: bytes) -> bool:
+    async def send_command(self, mac_address: str, data: bytes,
+                           response: bool = True) -> bool:
         """
         Send raw command to display.
         
         Args:
             mac_address: Target display
             data: Raw command bytes
+            response: Wait for the write to be acknowledged. False uses
+                      write-without-response where the device supports it
             
         Returns:
             True if sent successfully
         """
+        return await self._enqueue(mac_address, ((data, response),))
+    
+    async def _enqueue(self, mac_address: str,
+                       writes: Tuple[Tuple[bytes, bool], ...],
+                       image: bool = False) -> bool:
+        """
+        Queue writes for a display's writer task and wait for the result.
+        
+        Args:
+            mac_address: Target display
+            writes: (data, response) pairs, sent back to back
+            image: A full image transfer. If one is still waiting in the
+                   queue, it is replaced (and reports False) rather than
+                   sending a stale frame first.
+        """
+        queue = self._send_queues.get(mac_address)
+        if queue is None:
+            return False
+        
+        job = _SendJob(writes, asyncio.get_running_loop().create_future())
+        if image:
+            pending = self._pending_images.get(mac_address)
+            if pending is not None:
+                # Take over the queued slot; the superseded sender gets False
+                pending.writes, old_future = writes, pending.future
+                pending.future = job.future
+                if not old_future.done():
+                    old_future.set_result(False)
+                return await job.future
+            self._pending_images[mac_address] = job
+        
+        await queue.put(job)
+        if self._send_queues.get(mac_address) is not queue:
+            return False  # Disconnected while waiting for queue space
+        return await job.future
+    
+    def _start_writer(self, mac_address: str) -> None:
+        """Create a display's send queue and start its writer task."""
+        old_writer = self._writer_tasks.get(mac_address)
+        if old_writer:
+            old_writer.cancel()
+        self._pending_images.pop(mac_address, None)
+        self._send_queues[mac_address] = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+        self._writer_tasks[mac_address] = asyncio.create_task(
+            self._writer(mac_address))
+    
+    async def _writer(self, mac_address: str) -> None:
+        """
+        Sole writer for one display: runs queued jobs in order, so writes
+        from different callers never interleave on the characteristic.
+        """
+        queue = self._send_queues[mac_address]
+        job = None
+        try:
+            while True:
+                job = await queue.get()
+                if self._pending_images.get(mac_address) is job:
+                    del self._pending_images[mac_address]
+                
+                success = True
+                try:
+                    for data, response in job.writes:
+                        if not await self._write(mac_address, data, response):
+                            success = False
+                            break
+                except Exception as e:
+                    # Backend errors other than BleakError (OSError, D-Bus,
+                    # timeouts) fail this job but must not kill the writer
+                    logger.warning("Send failed to %s: %s", mac_address, e)
+                    await self.registry.set_state(mac_address, DisplayState.ERROR, str(e))
+                    success = False
+                if not job.future.done():
+                    job.future.set_result(success)
+                job = None
+        finally:
+            # Exiting for any reason other than _forget()/_start_writer()
+            # replacing us: drop the connection state so no sender waits on
+            # a queue nobody drains
+            if self._writer_tasks.get(mac_address) is asyncio.current_task():
+                self._forget(mac_address)
+            
+            # Fail the interrupted job and everything still queued
+            jobs = [job] if job else []
+            while not queue.empty():
+                jobs.append(queue.get_nowait())
+            for pending in jobs:
+                if not pending.future.done():
+                    pending.future.set_result(False)
+    
+    async def _write(self, mac_address: str, data: bytes, response: bool) -> bool:
+        """Perform one GATT write (writer task only)."""
         client = self._clients.get(mac_address)
         if not client or not client.is_connected:
             return False
         
+        if not response and mac_address not in self._unacked_writes:
+            response = True
+        
         try:
-            await client.write_gatt_char(CHARACTERISTIC_UUID, data)
+            await client.write_gatt_char(
+                self._chars.get(mac_address, CHARACTERISTIC_UUID),
+                data, response=response
+            )
+            self._bytes_sent += len(data)
             return True
         except BleakError as e:
-            print(f"Send failed to {mac_address}: {e}")
+            logger.warning("Send failed to %s: %s", mac_address, e)
             await self.registry.set_state(mac_address, DisplayState.ERROR, str(e))
             return False
     
     async def initialize_display(self, mac_address: str) -> bool:
         """Send initialization commands to enter graffiti mode."""
-        init_commands = [
-            bytes.fromhex("bc00010155"),  # Power on
-            bytes.fromhex("bc000d0d55"),  # Enter graffiti mode
-        ]
-        
-        for cmd in init_commands:
+        for cmd in (_INIT_POWER_ON, _INIT_GRAFFITI):
+            # Acknowledged write: returns once the device has the command
             if not await self.send_command(mac_address, cmd):
                 return False
-            await asyncio.sleep(0.05)
         
         return True
     
@@ -209,56 +504,67 @@ class BluetoothManager:
             pixel_index: Pixel position (0-255)
             r, g, b: Color values (0-255)
         """
+        r, g, b = r & 0xFF, g & 0xFF, b & 0xFF
+        if not await self._send_pixel(mac_address, pixel_index, r, g, b):
+            return False
+        # Keep the update loop's pixel diff in step with the device
+        self.registry.mark_pixel_sent(mac_address, pixel_index, r, g, b)
+        return True
+    
+    async def _send_pixel(self, mac_address: str,
+                          pixel_index: int, r: int, g: int, b: int) -> bool:
+        """Send a single-pixel command without touching the registry."""
         end_index = (pixel_index + 1) % 256
         if pixel_index == 0:
             end_index = 0xFF
         
-        command = bytearray([
+        command = _PIXEL_CMD.pack(
             0xBC, 0x01, 0x01, 0x00,
             pixel_index,
             r & 0xFF, g & 0xFF, b & 0xFF,
             end_index,
             0x55
-        ])
+        )
         
         return await self.send_command(mac_address, command)
     
-    async def send_full_image(self, mac_address: str, 
-                              pixels: List[tuple]) -> bool:
+    async def send_full_image(self, mac_address: str, pixels) -> bool:
         """
         Send full 16x16 image to display using block transfer.
         
         Args:
             mac_address: Target display
-            pixels: List of 256 (r, g, b) tuples
+            pixels: 768 packed RGB bytes (see DisplayInfo.frame_bytes())
+                    or a sequence of 256 (r, g, b) tuples
         """
-        if len(pixels) != 256:
+        if not isinstance(pixels, bytes):
+            # Flatten tuples once per frame; the uint8 cast wraps like & 0xFF
+            pixels = np.asarray(pixels).astype(np.uint8).tobytes()
+        if len(pixels) != 768:
             return False
         
-        # Start image transfer
-        await self.send_command(mac_address, bytes.fromhex("bc0ff1080855"))
-        await asyncio.sleep(0.002)
-        
-        # Send 8 blocks of 32 pixels each
-        for block_index in range(8):
-            start = block_index * 32
-            block_pixels = pixels[start:start + 32]
-            
-            # Build block command
-            header = bytearray([0xBC, 0x0F, (block_index + 1) & 0xFF])
-            pixel_data = bytearray()
-            for (r, g, b) in block_pixels:
-                pixel_data.extend([r & 0xFF, g & 0xFF, b & 0xFF])
-            
-            command = header + pixel_data + bytearray([0x55])
-            
-            if not await self.send_command(mac_address, command):
-                return False
-            await asyncio.sleep(0.025)
+        # Drop the frame into the prebuilt block grid in one copy; the
+        # result is all 8 block commands back to back
+        _IMG_BLOCKS[:, 3:-1] = np.frombuffer(pixels, dtype=np.uint8).reshape(8, 96)
+        stream = _IMG_BLOCKS.tobytes()
         
-        # End image transfer
-        await self.send_command(mac_address, bytes.fromhex("bc0ff2080955"))
+        # One block command per write, as the official app sends them (the
+        # firmware is not known to accept joined commands); blocks go out
+        # unacknowledged when the MTU allows, between the acknowledged
+        # start/end framing writes. The transfer is queued as one job so it
+        # cannot interleave with other writes to this display.
+        writes = (
+            (_IMG_START, True),
+            *((stream[i:i + BLOCK_COMMAND_SIZE], False)
+              for i in range(0, len(stream), BLOCK_COMMAND_SIZE)),
+            (_IMG_END, True),
+        )
+        if not await self._enqueue(mac_address, writes, image=True):
+            return False
         
+        # Record what the display now shows, so the next pixel diff in
+        # _refresh_one() compares against it
+        self.registry.mark_sent(mac_address, pixels)
         return True
     
     # ==================== Update Loop ====================
@@ -267,65 +573,155 @@ class BluetoothManager:
         """Start background task that sends pending updates to displays."""
         self._running = True
         self._update_task = asyncio.create_task(self._update_loop())
+        self._stats_task = asyncio.create_task(self._log_stats())
     
     async def stop_update_loop(self) -> None:
-        """Stop the background update loop."""
+        """Stop the background update loop and per-display workers."""
         self._running = False
-        if self._update_task:
-            self._update_task.cancel()
-            try:
-                await self._update_task
-            except asyncio.CancelledError:
-                pass
+        tasks = list(self._display_workers.values())
+        tasks += [t for t in (self._update_task, self._stats_task) if t]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
     
     async def _update_loop(self) -> None:
         """
-        Background loop that sends pending pixel updates to displays.
-        Processes displays sequentially (1 per interval for 4x4 grid support).
+        Background dispatcher for pending pixel updates.
+        Wakes on the registry's dirty notifications instead of polling.
+        Each connected dirty display gets its own worker task, so every
+        display refreshes at its own cadence and a slow link never holds
+        back the others.
         """
-        interval_ms = self.config.get_update_interval()
+        # Enable notifications, then pick up displays dirtied before that
+        self.registry.dirty_queue()
+        for display in self.registry.get_dirty_displays():
+            self._start_worker(display.mac_address)
         
         while self._running:
-            dirty_displays = self.registry.get_dirty_displays()
-            
-            for display in dirty_displays:
-                if not self.is_connected(display.mac_address):
-                    continue
-                
-                # Send full image
-                success = await self.send_full_image(
-                    display.mac_address, 
-                    display.pixel_buffer
-                )
+            self._start_worker(await self.registry.next_dirty())
+    
+    async def _log_stats(self) -> None:
+        """Log one send summary per interval instead of a line per write."""
+        while self._running:
+            await asyncio.sleep(STATS_INTERVAL)
+            if self._frames_sent or self._bytes_sent:
+                logger.debug("Sent %d frame(s), %d bytes in %.0fs",
+                             self._frames_sent, self._bytes_sent, STATS_INTERVAL)
+                self._frames_sent = self._bytes_sent = 0
+    
+    def _start_worker(self, mac_address: str) -> None:
+        """Start a refresh worker for a connected display unless one is running."""
+        if (mac_address not in self._display_workers
+                and self.is_connected(mac_address)):
+            self._display_workers[mac_address] = asyncio.create_task(
+                self._display_worker(mac_address))
+    
+    async def _display_worker(self, mac_address: str) -> None:
+        """Refresh one display until it has nothing left to send."""
+        interval = self.config.get_update_interval() / 1000.0
+        try:
+            while self._running:
+                display = self.registry.get_display(mac_address)
+                if (not display or not display.buffer_dirty
+                        or not self.is_connected(mac_address)):
+                    break
                 
-                if success:
-                    self.registry.clear_dirty_flag(display.mac_address)
+                try:
+                    await self._refresh_one(display)
+                except Exception as e:
+                    logger.warning("Update failed for %s: %s", mac_address, e)
                 
-                # Wait between display updates (1 second default)
-                await asyncio.sleep(interval_ms / 1000.0)
-            
-            # If no dirty displays, just wait a bit
-            if not dirty_displays:
-                await asyncio.sleep(0.1)
+                # Wait between frames for this display (1 second default)
+                await asyncio.sleep(interval)
+        finally:
+            self._display_workers.pop(mac_address, None)
+    
+    async def _refresh_one(self, display: DisplayInfo) -> bool:
+        """
+        Send a display's buffered frame and clear its dirty flag on success.
+        When only a few pixels changed since the last send, they go out as
+        single-pixel commands instead of a full image transfer.
+        """
+        mac_address = display.mac_address
+        frame = display.frame_bytes()
+        if display.buffer_hash == display.last_sent_hash:
+            # Edits since the last send put back the same frame
+            self.registry.clear_dirty_flag(mac_address, frame)
+            return True
+        
+        changed = self._changed_pixels(display.last_sent, frame)
+        # Single-pixel commands are acknowledged, one round trip each
+        if changed is not None and len(changed) < self._image_send_cost(mac_address):
+            pixels = np.frombuffer(frame, dtype=np.uint8).reshape(256, 3)
+            success = True
+            for index in changed.tolist():
+                r, g, b = pixels[index].tolist()
+                if not await self._send_pixel(mac_address, index, r, g, b):
+                    success = False
+                    break
+        else:
+            success = await self.send_full_image(mac_address, frame)
+        
+        if success:
+            self._frames_sent += 1
+            self.registry.clear_dirty_flag(mac_address, frame)
+        return success
+    
+    @staticmethod
+    def _changed_pixels(last_sent: Optional[bytes],
+                        frame: bytes) -> Optional[np.ndarray]:
+        """Indices of pixels that differ from the last sent frame (None = unknown)."""
+        if last_sent is None:
+            return None
+        old = np.frombuffer(last_sent, dtype=np.uint8).reshape(256, 3)
+        new = np.frombuffer(frame, dtype=np.uint8).reshape(256, 3)
+        return np.flatnonzero((old != new).any(axis=1))
+    
+    def _image_send_cost(self, mac_address: str) -> float:
+        """
+        Cost of a full image transfer in acknowledged round trips: acked
+        start/end framing plus 8 block writes, cheap when sent unacked.
+        """
+        block_cost = UNACKED_WRITE_COST if mac_address in self._unacked_writes else 1
+        return 2 + 8 * block_cost
     
     # ==================== Auto-Reconnect ====================
     
+    def _on_disconnect(self, mac_address: str, client: BleakClient) -> None:
+        """Bleak disconnect callback: schedule a reconnect for dropped links."""
+        if self._clients.get(mac_address) is not client:
+            return  # Deliberate disconnect() or a superseded client
+        
+        logger.warning("Connection lost to %s", mac_address)
+        self._forget(mac_address)
+        if self._running and mac_address not in self._reconnect_tasks:
+            self._reconnect_tasks[mac_address] = asyncio.create_task(
+                self._reconnect(mac_address))
+    
+    async def _reconnect(self, mac_address: str) -> None:
+        """Reconnect and re-initialize a display after a dropped link."""
+        try:
+            await self.registry.set_state(mac_address, DisplayState.DISCONNECTED)
+            if await self.connect(mac_address):
+                await self.initialize_display(mac_address)
+        finally:
+            self._reconnect_tasks.pop(mac_address, None)
+    
     async def monitor_connections(self) -> None:
-        """Monitor and auto-reconnect disconnected displays."""
+        """
+        Watchdog for drops the disconnect callback missed.
+        Reconnects are normally triggered by _on_disconnect.
+        """
         while self._running:
             for display in self.registry.get_all_displays():
-                if display.state == DisplayState.CONNECTED:
-                    # Check if still connected
-                    client = self._clients.get(display.mac_address)
-                    if not client or not client.is_connected:
-                        await self.registry.set_state(
-                            display.mac_address, 
-                            DisplayState.DISCONNECTED
-                        )
-                        # Try to reconnect
-                        await self.connect(display.mac_address)
+                mac_address = display.mac_address
+                if (display.state == DisplayState.CONNECTED
+                        and not self.is_connected(mac_address)
+                        and mac_address not in self._reconnect_tasks):
+                    self._forget(mac_address)
+                    await self._reconnect(mac_address)
             
-            await asyncio.sleep(5)  # Check every 5 seconds
+            await asyncio.sleep(WATCHDOG_INTERVAL)
 
 
 # Singleton instance
@@ -375,4 +771,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
     asyncio.run(main())